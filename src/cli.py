@@ -1,7 +1,10 @@
 """Command-line interface for GitHub Stats Card generator."""
 
-import os
+import functools
 import sys
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
 
 import click
 
@@ -13,21 +16,25 @@ from .core.config import (
     UserStatsCardConfig,
     UserStatsFetchConfig,
 )
+from .core.constants import MAXIMUM_LANGS_COUNT
 from .core.exceptions import FetchError, LanguageFetchError
-from .github.fetcher import fetch_contributor_stats, fetch_user_stats
-from .github.langs_fetcher import fetch_top_languages
-from .rendering.contrib import render_contrib_card
-from .rendering.langs import render_top_languages
-from .rendering.user_stats import render_user_stats_card
-
-# Weighting presets for language ranking
-WEIGHTING_PRESETS = {
-    "size-only": {"size_weight": 1.0, "count_weight": 0.0},
-    "balanced": {"size_weight": 0.7, "count_weight": 0.3},
-    "expertise": {"size_weight": 0.5, "count_weight": 0.5},
-    "diversity": {"size_weight": 0.4, "count_weight": 0.6},
+from .core.utils import parse_list_arg
+
+# Weighting presets for language ranking: name -> (size_weight, count_weight)
+WEIGHTING_PRESETS: dict[str, tuple[float, float]] = {
+    "size-only": (1.0, 0.0),
+    "balanced": (0.7, 0.3),
+    "expertise": (0.5, 0.5),
+    "diversity": (0.4, 0.6),
 }
 
+# Choice types for enumerated options, built once at import
+_NUMBER_FORMAT_CHOICE = click.Choice(("short", "long"))
+_RANK_ICON_CHOICE = click.Choice(("default", "github", "percentile"))
+_LAYOUT_CHOICE = click.Choice(("normal", "compact", "donut", "donut-vertical", "pie"))
+_WEIGHTING_CHOICE = click.Choice(tuple(WEIGHTING_PRESETS))
+_STATS_FORMAT_CHOICE = click.Choice(("percentages", "bytes"))
+
 
 # Command aliases for backward compatibility
 COMMAND_ALIASES = {
@@ -46,24 +53,172 @@ class AliasGroup(click.Group):
     def resolve_command(
         self, ctx: click.Context, args: list[str]
     ) -> tuple[str | None, click.Command | None, list[str]]:
+        # get_command is alias-aware, so cmd is already the canonical command
         cmd_name, cmd, remaining = super().resolve_command(ctx, args)
         # Resolve alias so help text shows the canonical name
-        if cmd_name and cmd_name in COMMAND_ALIASES:
-            canonical = COMMAND_ALIASES[cmd_name]
-            cmd = super().get_command(ctx, canonical)
-            cmd_name = canonical
+        if cmd_name in COMMAND_ALIASES:
+            cmd_name = COMMAND_ALIASES[cmd_name]
         return cmd_name, cmd, remaining
 
 
-def _write_svg_file(svg: str, output: str) -> None:
-    """Write SVG content to file, creating parent directories as needed."""
-    output_path = os.path.abspath(output)
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+def handle_errors[**P, R](expected_exc: type[Exception], message: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Report command failures on stderr and exit with status 1.
+
+    Args:
+        expected_exc: Exception type that signals a known fetch failure
+        message: Prefix shown before the error for *expected_exc*
+
+    Returns:
+        Decorator wrapping a command callback
+    """
+
+    def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return fn(*args, **kwargs)
+            except click.ClickException:
+                # Let Click render usage errors such as BadParameter itself
+                raise
+            except expected_exc as e:
+                click.echo(f"❌ {message}: {e}", err=True)
+                sys.exit(1)
+            except Exception as e:
+                click.echo(f"❌ Unexpected error: {e}", err=True)
+                sys.exit(1)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(svg)
+        return wrapper
 
-    click.echo(f"✅ Generated {output_path}", err=True)
+    return decorator
+
+
+def _is_unchanged(path: Path, data: bytes) -> bool:
+    """Check whether the file at *path* already holds exactly *data*."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def _write_svg_file(svg: str, output: str) -> None:
+    """Write SVG content to file, creating parent directories as needed.
+
+    Regenerating an identical card leaves the existing file untouched, so
+    scheduled workflows don't churn its mtime.
+    """
+    output_path = Path(output)
+    parent = output_path.parent
+    # A bare file name has no parent parts (the cwd always exists); otherwise repeated runs
+    # write into an existing directory, so skip mkdir's per-component stat walk
+    if parent.parts and not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+
+    data = svg.encode("utf-8")
+    # The absolute path is only needed for the success message; absolute() just prepends the
+    # cwd, whereas resolve() would lstat every component to follow symlinks
+    if _is_unchanged(output_path, data):
+        click.echo(f"✅ Generated {output_path.absolute()} (unchanged)", err=True)
+        return
+
+    # Encode once and write the whole buffer in binary mode, bypassing the text-layer encoder
+    output_path.write_bytes(data)
+
+    click.echo(f"✅ Generated {output_path.absolute()}", err=True)
+
+
+def _apply_options[FC: Callable[..., Any]](options: Sequence[Callable[[FC], FC]]) -> Callable[[FC], FC]:
+    """Apply a shared list of Click options to a command, keeping their listed order in --help."""
+
+    def decorator(f: FC) -> FC:
+        for option in reversed(options):
+            f = option(f)
+        return f
+
+    return decorator
+
+
+# Options every command takes, built once and shared instead of redeclared per command
+_SOURCE_OPTIONS = [
+    click.option(
+        "--username",
+        "-u",
+        required=True,
+        help="GitHub username",
+    ),
+    click.option(
+        "--token",
+        "-t",
+        envvar="GITHUB_TOKEN",
+        required=True,
+        help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
+    ),
+    click.option(
+        "--output",
+        "-o",
+        required=True,
+        type=click.Path(),
+        help="Output SVG file path",
+    ),
+    click.option(
+        "--cache-ttl",
+        type=click.IntRange(min=0),
+        default=600,
+        help="Seconds to reuse cached GitHub API responses (default: 600)",
+    ),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Always query GitHub instead of using cached API responses",
+    ),
+]
+
+_STYLE_OPTIONS = [
+    click.option(
+        "--theme",
+        default="default",
+        help="Theme name (default, dark, radical, etc.)",
+    ),
+    click.option(
+        "--hide-border",
+        is_flag=True,
+        help="Hide card border",
+    ),
+    click.option(
+        "--hide-title",
+        is_flag=True,
+        help="Hide card title",
+    ),
+    click.option(
+        "--title-color",
+        help="Custom title color (hex without #)",
+    ),
+    click.option(
+        "--text-color",
+        help="Custom text color (hex without #)",
+    ),
+    click.option(
+        "--border-color",
+        help="Custom border color (hex without #)",
+    ),
+    click.option(
+        "--border-radius",
+        type=float,
+        default=4.5,
+        help="Border radius (default: 4.5)",
+    ),
+    click.option(
+        "--disable-animations",
+        is_flag=True,
+        help="Disable CSS animations",
+    ),
+    click.option(
+        "--minify",
+        is_flag=True,
+        help="Strip indentation and whitespace between tags from the SVG output",
+    ),
+]
 
 
 @click.group(cls=AliasGroup)
@@ -72,46 +227,12 @@ def cli() -> None:
 
 
 @cli.command(name="user-stats")
-@click.option(
-    "--username",
-    "-u",
-    required=True,
-    help="GitHub username",
-)
-@click.option(
-    "--token",
-    "-t",
-    envvar="GITHUB_TOKEN",
-    required=True,
-    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
-)
-@click.option(
-    "--output",
-    "-o",
-    required=True,
-    type=click.Path(),
-    help="Output SVG file path",
-)
-@click.option(
-    "--theme",
-    default="default",
-    help="Theme name (default, dark, radical, etc.)",
-)
+@_apply_options(_SOURCE_OPTIONS)
 @click.option(
     "--show-icons",
     is_flag=True,
     help="Show icons next to stats",
 )
-@click.option(
-    "--hide-border",
-    is_flag=True,
-    help="Hide card border",
-)
-@click.option(
-    "--hide-title",
-    is_flag=True,
-    help="Hide card title",
-)
 @click.option(
     "--hide-rank",
     is_flag=True,
@@ -137,14 +258,6 @@ def cli() -> None:
     default="",
     help="Comma-separated additional stats to show (e.g., reviews,discussions_started)",
 )
-@click.option(
-    "--title-color",
-    help="Custom title color (hex without #)",
-)
-@click.option(
-    "--text-color",
-    help="Custom text color (hex without #)",
-)
 @click.option(
     "--icon-color",
     help="Custom icon color (hex without #)",
@@ -153,10 +266,6 @@ def cli() -> None:
     "--bg-color",
     help="Custom background color (hex without # or gradient: angle,color1,color2)",
 )
-@click.option(
-    "--border-color",
-    help="Custom border color (hex without #)",
-)
 @click.option(
     "--ring-color",
     help="Custom rank ring color (hex without #)",
@@ -177,47 +286,40 @@ def cli() -> None:
 )
 @click.option(
     "--line-height",
-    type=int,
+    type=click.IntRange(min=1),
     default=25,
     help="Line height between stats (default: 25)",
 )
-@click.option(
-    "--border-radius",
-    type=float,
-    default=4.5,
-    help="Border radius (default: 4.5)",
-)
 @click.option(
     "--number-format",
-    type=click.Choice(["short", "long"]),
+    type=_NUMBER_FORMAT_CHOICE,
     default="short",
     help="Number format: short (6.6k) or long (6626)",
 )
 @click.option(
     "--number-precision",
-    type=int,
+    type=click.IntRange(0, 2),
     help="Decimal places for short format (0-2)",
 )
 @click.option(
     "--rank-icon",
-    type=click.Choice(["default", "github", "percentile"]),
+    type=_RANK_ICON_CHOICE,
     default="default",
     help="Rank icon style",
 )
-@click.option(
-    "--disable-animations",
-    is_flag=True,
-    help="Disable CSS animations",
-)
 @click.option(
     "--text-bold/--no-text-bold",
     default=True,
     help="Use bold text (default: yes)",
 )
+@_apply_options(_STYLE_OPTIONS)
+@handle_errors(FetchError, "Error fetching data")
 def user_stats(
     username: str,
     token: str,
     output: str,
+    cache_ttl: int,
+    no_cache: bool,
     theme: str,
     show_icons: bool,
     hide_border: bool,
@@ -242,6 +344,7 @@ def user_stats(
     number_precision: int | None,
     rank_icon: str,
     disable_animations: bool,
+    minify: bool,
     text_bold: bool,
 ) -> None:
     """
@@ -269,99 +372,63 @@ def user_stats(
       # Backward-compatible alias
       github-stats-card stats -u octocat -o stats.svg
     """
-    try:
-        # Create fetch configuration
-        fetch_config = UserStatsFetchConfig.from_cli_args(
-            username=username,
-            token=token,
-            include_all_commits=include_all_commits,
-            commits_year=commits_year,
-            show=show,
-        )
-
-        # Fetch stats from GitHub
-        click.echo(f"Fetching GitHub stats for {username}...", err=True)
-        user_stats_data = fetch_user_stats(fetch_config)
-
-        click.echo(f"Found stats for {user_stats_data['name']} (@{user_stats_data['login']})", err=True)
-
-        # Create rendering configuration
-        render_config = UserStatsCardConfig.from_cli_args(
-            theme=theme,
-            show_icons=show_icons,
-            hide_border=hide_border,
-            hide_title=hide_title,
-            hide_rank=hide_rank,
-            include_all_commits=include_all_commits,
-            hide=hide,
-            show=show,
-            title_color=title_color,
-            text_color=text_color,
-            icon_color=icon_color,
-            bg_color=bg_color,
-            border_color=border_color,
-            ring_color=ring_color,
-            custom_title=custom_title,
-            locale=locale,
-            card_width=card_width,
-            line_height=line_height,
-            border_radius=border_radius,
-            number_format=number_format,
-            number_precision=number_precision,
-            rank_icon=rank_icon,
-            disable_animations=disable_animations,
-            text_bold=text_bold,
-        )
-
-        # Render SVG card
-        click.echo("Generating SVG card...", err=True)
-        svg = render_user_stats_card(user_stats_data, render_config)
-        _write_svg_file(svg, output)
-
-    except FetchError as e:
-        click.echo(f"❌ Error fetching data: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"❌ Unexpected error: {e}", err=True)
-        sys.exit(1)
+    # Imported here so other subcommands (and --help) don't pay for the HTTP/rendering stack
+    from .github.fetcher import fetch_user_stats
+    from .rendering.user_stats import render_user_stats_card
+
+    # Create fetch configuration
+    fetch_config = UserStatsFetchConfig.from_cli_args(
+        username=username,
+        token=token,
+        cache_ttl=0 if no_cache else cache_ttl,
+        include_all_commits=include_all_commits,
+        commits_year=commits_year,
+        show=show,
+    )
+
+    # Fetch stats from GitHub
+    click.echo(f"Fetching GitHub stats for {username}...", err=True)
+    user_stats_data = fetch_user_stats(fetch_config)
+
+    click.echo(f"Found stats for {user_stats_data['name']} (@{user_stats_data['login']})", err=True)
+
+    # Create rendering configuration
+    render_config = UserStatsCardConfig.from_cli_args(
+        theme=theme,
+        show_icons=show_icons,
+        hide_border=hide_border,
+        hide_title=hide_title,
+        hide_rank=hide_rank,
+        include_all_commits=include_all_commits,
+        hide=hide,
+        show=show,
+        title_color=title_color,
+        text_color=text_color,
+        icon_color=icon_color,
+        bg_color=bg_color,
+        border_color=border_color,
+        ring_color=ring_color,
+        custom_title=custom_title,
+        locale=locale,
+        card_width=card_width,
+        line_height=line_height,
+        border_radius=border_radius,
+        number_format=number_format,
+        number_precision=number_precision,
+        rank_icon=rank_icon,
+        disable_animations=disable_animations,
+        minify=minify,
+        text_bold=text_bold,
+    )
+
+    # Render SVG card
+    click.echo("Generating SVG card...", err=True)
+    svg = render_user_stats_card(user_stats_data, render_config)
+    _write_svg_file(svg, output)
 
 
 @cli.command(name="top-langs")
-@click.option(
-    "--username",
-    "-u",
-    required=True,
-    help="GitHub username",
-)
-@click.option(
-    "--token",
-    "-t",
-    envvar="GITHUB_TOKEN",
-    required=True,
-    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
-)
-@click.option(
-    "--output",
-    "-o",
-    required=True,
-    type=click.Path(),
-    help="Output SVG file path",
-)
-@click.option(
-    "--theme",
-    default="default",
-    help="Theme name (default, dark, radical, etc.)",
-)
-@click.option(
-    "--hide-border",
-    is_flag=True,
-    help="Hide card border",
-)
-@click.option(
-    "--hide-title",
-    is_flag=True,
-    help="Hide card title",
-)
+@_apply_options(_SOURCE_OPTIONS)
 @click.option(
     "--hide-progress",
     is_flag=True,
@@ -369,14 +436,14 @@ def user_stats(
 )
 @click.option(
     "--layout",
-    type=click.Choice(["normal", "compact", "donut", "donut-vertical", "pie"]),
+    type=_LAYOUT_CHOICE,
     default="normal",
     help="Card layout style",
 )
 @click.option(
     "--langs-count",
-    type=int,
-    help="Number of languages to show (1-20)",
+    type=click.IntRange(1, MAXIMUM_LANGS_COUNT),
+    help=f"Number of languages to show (1-{MAXIMUM_LANGS_COUNT})",
 )
 @click.option(
     "--hide",
@@ -390,7 +457,7 @@ def user_stats(
 )
 @click.option(
     "--weighting",
-    type=click.Choice(["size-only", "balanced", "expertise", "diversity"]),
+    type=_WEIGHTING_CHOICE,
     help="Weighting preset: size-only (default), balanced (70/30), expertise (50/50), diversity (40/60)",
 )
 @click.option(
@@ -408,47 +475,28 @@ def user_stats(
     type=int,
     help="Card width in pixels (min: 280)",
 )
-@click.option(
-    "--title-color",
-    help="Custom title color (hex without #)",
-)
-@click.option(
-    "--text-color",
-    help="Custom text color (hex without #)",
-)
 @click.option(
     "--bg-color",
     help="Custom background color or gradient (hex or angle,color1,color2)",
 )
-@click.option(
-    "--border-color",
-    help="Custom border color (hex without #)",
-)
 @click.option(
     "--custom-title",
     help="Custom card title",
 )
-@click.option(
-    "--border-radius",
-    type=float,
-    default=4.5,
-    help="Border radius (default: 4.5)",
-)
 @click.option(
     "--stats-format",
-    type=click.Choice(["percentages", "bytes"]),
+    type=_STATS_FORMAT_CHOICE,
     default="percentages",
     help="Display format for stats",
 )
-@click.option(
-    "--disable-animations",
-    is_flag=True,
-    help="Disable CSS animations",
-)
+@_apply_options(_STYLE_OPTIONS)
+@handle_errors(LanguageFetchError, "Error fetching language data")
 def top_langs(
     username: str,
     token: str,
     output: str,
+    cache_ttl: int,
+    no_cache: bool,
     theme: str,
     hide_border: bool,
     hide_title: bool,
@@ -469,6 +517,7 @@ def top_langs(
     border_radius: float,
     stats_format: str,
     disable_animations: bool,
+    minify: bool,
 ) -> None:
     """
     Generate Top Languages Card SVG.
@@ -497,101 +546,71 @@ def top_langs(
       github-stats-card top-langs -u octocat -o langs.svg \\
         --weighting balanced
     """
-    try:
-        # Resolve weighting preset if specified
-        final_size_weight = size_weight
-        final_count_weight = count_weight
-
-        if weighting:
-            preset = WEIGHTING_PRESETS[weighting]
-            # Only use preset values if individual weights not specified
-            if size_weight is None:
-                final_size_weight = preset["size_weight"]
-            if count_weight is None:
-                final_count_weight = preset["count_weight"]
-
-        # Apply defaults if still None
-        if final_size_weight is None:
-            final_size_weight = 1.0
-        if final_count_weight is None:
-            final_count_weight = 0.0
-
-        # Create fetch configuration
-        fetch_config = LangsFetchConfig.from_cli_args(
-            username=username,
-            token=token,
-            exclude_repo=exclude_repo,
-            size_weight=final_size_weight,
-            count_weight=final_count_weight,
-        )
-
-        # Fetch languages from GitHub
-        click.echo(f"Fetching language data for {username}...", err=True)
-        top_languages = fetch_top_languages(fetch_config)
-
-        if not top_languages:
-            click.echo("⚠️  No languages found", err=True)
-        else:
-            click.echo(f"Found {len(top_languages)} languages across repositories", err=True)
-
-        # Create rendering configuration
-        render_config = LangsCardConfig.from_cli_args(
-            hide=hide,
-            hide_title=hide_title,
-            hide_border=hide_border,
-            hide_progress=hide_progress,
-            card_width=card_width,
-            layout=layout,
-            langs_count=langs_count,
-            theme=theme,
-            custom_title=custom_title,
-            title_color=title_color,
-            text_color=text_color,
-            bg_color=bg_color,
-            border_color=border_color,
-            border_radius=border_radius,
-            stats_format=stats_format,
-            disable_animations=disable_animations,
-        )
-
-        # Render SVG card
-        click.echo("Generating SVG card...", err=True)
-        svg = render_top_languages(top_languages, render_config)
-        _write_svg_file(svg, output)
-
-    except LanguageFetchError as e:
-        click.echo(f"❌ Error fetching language data: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"❌ Unexpected error: {e}", err=True)
-        sys.exit(1)
+    from .github.langs_fetcher import fetch_top_languages
+    from .rendering.langs import render_top_languages
+
+    # Resolve weighting preset; explicit weights take precedence over the preset
+    if weighting and (size_weight is None or count_weight is None):
+        preset_size, preset_count = WEIGHTING_PRESETS[weighting]
+        size_weight = preset_size if size_weight is None else size_weight
+        count_weight = preset_count if count_weight is None else count_weight
+
+    # Apply defaults if still None
+    final_size_weight = 1.0 if size_weight is None else size_weight
+    final_count_weight = 0.0 if count_weight is None else count_weight
+
+    # Create fetch configuration
+    fetch_config = LangsFetchConfig.from_cli_args(
+        username=username,
+        token=token,
+        cache_ttl=0 if no_cache else cache_ttl,
+        exclude_repo=exclude_repo,
+        size_weight=final_size_weight,
+        count_weight=final_count_weight,
+    )
+
+    # Fetch languages from GitHub
+    click.echo(f"Fetching language data for {username}...", err=True)
+    top_languages = fetch_top_languages(fetch_config)
+
+    if not top_languages:
+        click.echo("⚠️  No languages found", err=True)
+    else:
+        click.echo(f"Found {len(top_languages)} languages across repositories", err=True)
+
+    # Create rendering configuration
+    render_config = LangsCardConfig.from_cli_args(
+        hide=hide,
+        hide_title=hide_title,
+        hide_border=hide_border,
+        hide_progress=hide_progress,
+        card_width=card_width,
+        layout=layout,
+        langs_count=langs_count,
+        theme=theme,
+        custom_title=custom_title,
+        title_color=title_color,
+        text_color=text_color,
+        bg_color=bg_color,
+        border_color=border_color,
+        border_radius=border_radius,
+        stats_format=stats_format,
+        disable_animations=disable_animations,
+        minify=minify,
+    )
+
+    # Render SVG card
+    click.echo("Generating SVG card...", err=True)
+    svg = render_top_languages(top_languages, render_config)
+    _write_svg_file(svg, output)
 
 
 @cli.command(name="contrib")
-@click.option(
-    "--username",
-    "-u",
-    required=True,
-    help="GitHub username",
-)
-@click.option(
-    "--token",
-    "-t",
-    envvar="GITHUB_TOKEN",
-    required=True,
-    help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)",
-)
-@click.option(
-    "--output",
-    "-o",
-    required=True,
-    type=click.Path(),
-    help="Output SVG file path",
-)
+@_apply_options(_SOURCE_OPTIONS)
 @click.option(
     "--limit",
     "-l",
-    type=int,
+    type=click.IntRange(min=1),
     default=10,
     help="Number of repositories to show (default: 10)",
 )
@@ -600,57 +619,19 @@ def top_langs(
     default="",
     help="Comma-separated repos to exclude",
 )
-@click.option(
-    "--theme",
-    default="default",
-    help="Theme name (default, dark, radical, etc.)",
-)
-@click.option(
-    "--hide-border",
-    is_flag=True,
-    help="Hide card border",
-)
-@click.option(
-    "--hide-title",
-    is_flag=True,
-    help="Hide card title",
-)
 @click.option(
     "--card-width",
     type=int,
     help="Card width in pixels (default: 467)",
 )
-@click.option(
-    "--title-color",
-    help="Custom title color (hex without #)",
-)
-@click.option(
-    "--text-color",
-    help="Custom text color (hex without #)",
-)
 @click.option(
     "--bg-color",
     help="Custom background color (hex without # or gradient)",
 )
-@click.option(
-    "--border-color",
-    help="Custom border color (hex without #)",
-)
 @click.option(
     "--custom-title",
     help="Custom card title text",
 )
-@click.option(
-    "--border-radius",
-    type=float,
-    default=4.5,
-    help="Border radius (default: 4.5)",
-)
-@click.option(
-    "--disable-animations",
-    is_flag=True,
-    help="Disable CSS animations",
-)
 @click.option(
     "--types",
     "--contrib-types",
@@ -658,10 +639,14 @@ def top_langs(
     default="commits,prs",
     help="Comma-separated list of contribution types to fetch (commits,prs,issues,reviews)",
 )
+@_apply_options(_STYLE_OPTIONS)
+@handle_errors(FetchError, "Error fetching data")
 def contrib(
     username: str,
     token: str,
     output: str,
+    cache_ttl: int,
+    no_cache: bool,
     limit: int,
     exclude_repo: str,
     theme: str,
@@ -675,6 +660,7 @@ def contrib(
     custom_title: str | None,
     border_radius: float,
     disable_animations: bool,
+    minify: bool,
     contribution_types: str,
 ) -> None:
     """
@@ -698,8 +684,11 @@ def contrib(
     """
     from src.core.constants import VALID_CONTRIB_TYPES
 
-    # Validate contribution types (outside try so Click handles BadParameter natively)
-    parsed_types = [t.strip() for t in contribution_types.split(",") if t.strip()]
+    from .github.fetcher import fetch_contributor_stats
+    from .rendering.contrib import render_contrib_card
+
+    # Validate contribution types; handle_errors lets BadParameter through to Click
+    parsed_types = parse_list_arg(contribution_types)
     if not parsed_types:
         raise click.BadParameter(
             f"At least one contribution type is required. Allowed: {', '.join(sorted(VALID_CONTRIB_TYPES))}"
@@ -710,48 +699,42 @@ def contrib(
                 f"Invalid contribution type '{c_type}'. Allowed: {', '.join(sorted(VALID_CONTRIB_TYPES))}"
             )
 
-    try:
-        # Create fetch configuration (pass parsed list to avoid double-parsing)
-        fetch_config = ContribFetchConfig.from_cli_args(
-            username=username,
-            token=token,
-            limit=limit,
-            exclude_repo=exclude_repo,
-            contribution_types=parsed_types,
-        )
-
-        # Fetch stats from GitHub
-        click.echo(f"Fetching contribution stats for {username}...", err=True)
-        stats = fetch_contributor_stats(fetch_config)
-
-        click.echo(f"Found {len(stats['repos'])} repositories", err=True)
-
-        # Create rendering configuration
-        render_config = ContribCardConfig.from_cli_args(
-            theme=theme,
-            hide_border=hide_border,
-            hide_title=hide_title,
-            card_width=card_width,
-            title_color=title_color,
-            text_color=text_color,
-            bg_color=bg_color,
-            border_color=border_color,
-            custom_title=custom_title,
-            border_radius=border_radius,
-            disable_animations=disable_animations,
-        )
-
-        # Render SVG card
-        click.echo("Generating SVG card...", err=True)
-        svg = render_contrib_card(stats, render_config)
-        _write_svg_file(svg, output)
-
-    except FetchError as e:
-        click.echo(f"❌ Error fetching data: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"❌ Unexpected error: {e}", err=True)
-        sys.exit(1)
+    # Create fetch configuration (pass parsed tuple to avoid double-parsing)
+    fetch_config = ContribFetchConfig.from_cli_args(
+        username=username,
+        token=token,
+        cache_ttl=0 if no_cache else cache_ttl,
+        limit=limit,
+        exclude_repo=exclude_repo,
+        contribution_types=parsed_types,
+    )
+
+    # Fetch stats from GitHub
+    click.echo(f"Fetching contribution stats for {username}...", err=True)
+    stats = fetch_contributor_stats(fetch_config)
+
+    click.echo(f"Found {len(stats['repos'])} repositories", err=True)
+
+    # Create rendering configuration
+    render_config = ContribCardConfig.from_cli_args(
+        theme=theme,
+        hide_border=hide_border,
+        hide_title=hide_title,
+        card_width=card_width,
+        title_color=title_color,
+        text_color=text_color,
+        bg_color=bg_color,
+        border_color=border_color,
+        custom_title=custom_title,
+        border_radius=border_radius,
+        disable_animations=disable_animations,
+        minify=minify,
+    )
+
+    # Render SVG card
+    click.echo("Generating SVG card...", err=True)
+    svg = render_contrib_card(stats, render_config)
+    _write_svg_file(svg, output)
 
 
 if __name__ == "__main__":
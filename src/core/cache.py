@@ -0,0 +1,188 @@
+"""On-disk TTL cache for GitHub API responses."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .constants import PAST_YEARS_CACHE_TTL
+
+CACHE_DIR_NAME = "github-stats-cards"
+# Entries kept in process memory in front of the disk cache
+MEMORY_CACHE_SIZE = 128
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory, honoring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / CACHE_DIR_NAME
+
+
+class ResponseCache:
+    """JSON response cache stored as one file per key, expired by file age.
+
+    Recently used entries are also kept in a small in-memory LRU, so a key read
+    twice in one run is decoded from disk only once. Entries may carry an HTTP
+    ETag, which lets callers revalidate an expired entry with a conditional
+    request instead of downloading it again.
+
+    The first write of each instance also deletes files older than the longest
+    TTL in use, so keys for old tokens, users or options do not pile up.
+
+    Cache problems never fail a fetch: unreadable, corrupt or unwritable
+    entries are treated as misses.
+    """
+
+    def __init__(self, ttl: float, directory: Path | None = None, memory_size: int = MEMORY_CACHE_SIZE) -> None:
+        self.ttl = ttl
+        self.directory = directory or default_cache_dir()
+        self.memory_size = memory_size
+        # key -> (time stored, value); values are shared, callers must not mutate them
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._pruned = False
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from request components.
+
+        Args:
+            *parts: Strings identifying the request (endpoint, token digest, payload, ...)
+
+        Returns:
+            Hex digest usable as a file name
+        """
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _etag_path(self, key: str) -> Path:
+        return self.directory / f"{key}.etag"
+
+    def _remember(self, key: str, value: Any, stored_at: float) -> None:  # noqa: ANN401
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, ttl: float | None = None) -> Any | None:  # noqa: ANN401
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+            ttl: Maximum age in seconds for this lookup, overriding the cache's TTL
+
+        Returns:
+            Decoded JSON value, or None if missing, expired or unreadable
+        """
+        max_age = self.ttl if ttl is None else ttl
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None and now - entry[0] < max_age:
+            self._memory.move_to_end(key)
+            return entry[1]
+
+        path = self._path(key)
+        try:
+            stored_at = path.stat().st_mtime
+            if now - stored_at >= max_age:
+                return None
+            value = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        self._remember(key, value, stored_at)
+        return value
+
+    def etag(self, key: str) -> str | None:
+        """
+        Return the ETag stored with an entry, even if the entry has expired.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            ETag header value, or None if the entry has none
+        """
+        try:
+            return self._etag_path(key).read_text(encoding="utf-8") or None
+        except OSError:
+            return None
+
+    def revalidate(self, key: str) -> Any | None:  # noqa: ANN401
+        """
+        Mark an expired entry fresh again after the server confirmed it (HTTP 304).
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The stored value, or None if it can no longer be read
+        """
+        path = self._path(key)
+        try:
+            value = json.loads(path.read_bytes())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        self._remember(key, value, time.time())
+        return value
+
+    def prune(self) -> None:
+        """Delete entries too old to be fresh under any TTL in use, with their ETags and stray temp files."""
+        cutoff = time.time() - max(self.ttl, PAST_YEARS_CACHE_TTL)
+        try:
+            with os.scandir(self.directory) as entries:
+                names = {entry.name: entry for entry in entries}
+        except OSError:
+            return
+        for name, entry in names.items():
+            stem, _, suffix = name.rpartition(".")
+            if suffix == "etag" and f"{stem}.json" in names:
+                continue  # Removed together with its entry
+            with contextlib.suppress(OSError):
+                if suffix in ("json", "etag", "tmp") and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    if suffix == "json":
+                        self._etag_path(stem).unlink(missing_ok=True)
+
+    def set(self, key: str, value: Any, etag: str | None = None) -> None:  # noqa: ANN401
+        """
+        Store a response, replacing any previous entry atomically.
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable response data
+            etag: Optional ETag header value for later conditional requests
+        """
+        self._remember(key, value, time.time())
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        etag_path = self._etag_path(key)
+        try:
+            if not self.directory.is_dir():
+                self.directory.mkdir(parents=True, exist_ok=True)
+            # Drop the old ETag first so it can never end up paired with a newer body
+            etag_path.unlink(missing_ok=True)
+            # mkstemp creates the file 0600, which suits responses fetched with a private token
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, self._path(key))
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            return
+        if etag:
+            with contextlib.suppress(OSError):
+                etag_path.write_text(etag, encoding="utf-8")
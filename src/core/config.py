@@ -1,15 +1,26 @@
 """Configuration dataclasses for GitHub Stats Card rendering."""
 
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar
 
 from .utils import parse_list_arg
 
+# Fields given on the CLI as comma-separated strings
+_LIST_FIELDS = frozenset({"hide", "show", "exclude_repo", "contribution_types"})
 
-@dataclass
+
+def _field_names(cls: type) -> frozenset[str]:
+    """Field names of a config dataclass (fields() skips ClassVar pseudo-fields)."""
+    return frozenset(f.name for f in fields(cls))
+
+
+@dataclass(frozen=True, slots=True)
 class BaseConfig:
     """Base configuration class with CLI argument parsing."""
 
+    # Dataclass field names, assigned per class at the bottom of this module
+    _VALID_FIELDS: ClassVar[frozenset[str]] = frozenset()
+
     @classmethod
     def from_cli_args(cls, **kwargs: Any) -> Any:  # noqa: ANN401
         """
@@ -24,19 +35,22 @@ class BaseConfig:
         Returns:
             Config instance
         """
-        # Filter out None values and keys not in dataclass
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in kwargs.items() if k in valid_fields and v is not None}
-
-        # Handle known list fields
-        for list_key in ["hide", "show", "exclude_repo", "contribution_types"]:
-            if list_key in filtered:
-                filtered[list_key] = parse_list_arg(filtered[list_key])
+        # Read the class's own entry so a subclass never filters with its parent's field set
+        valid_fields: frozenset[str] | None = cls.__dict__.get("_VALID_FIELDS")
+        if valid_fields is None:
+            # Subclass defined outside this module: cache its field names on first use
+            valid_fields = cls._VALID_FIELDS = _field_names(cls)
+        # Single fused pass: drop unknown/None values and parse known list fields inline
+        filtered = {
+            k: parse_list_arg(v) if k in _LIST_FIELDS else v
+            for k, v in kwargs.items()
+            if v is not None and k in valid_fields
+        }
 
         return cls(**filtered)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CardStyleConfig(BaseConfig):
     """Shared visual/style configuration for all card types."""
 
@@ -61,8 +75,11 @@ class CardStyleConfig(BaseConfig):
     # Animation options
     disable_animations: bool = False
 
+    # Output options
+    minify: bool = False
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserStatsCardConfig(CardStyleConfig):
     """Configuration for user stats card rendering."""
 
@@ -71,8 +88,8 @@ class UserStatsCardConfig(CardStyleConfig):
     ring_color: str | None = None
 
     # Visibility options
-    hide: list[str] = field(default_factory=list)
-    show: list[str] = field(default_factory=list)
+    hide: tuple[str, ...] = ()
+    show: tuple[str, ...] = ()
     hide_rank: bool = False
     show_icons: bool = False
 
@@ -94,12 +111,12 @@ class UserStatsCardConfig(CardStyleConfig):
     include_all_commits: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LangsCardConfig(CardStyleConfig):
     """Configuration for top languages card rendering."""
 
     # Visibility options
-    hide: list[str] = field(default_factory=list)
+    hide: tuple[str, ...] = ()
     hide_progress: bool = False
 
     # Layout options
@@ -107,7 +124,7 @@ class LangsCardConfig(CardStyleConfig):
 
     # Language options
     langs_count: int | None = None
-    exclude_repo: list[str] = field(default_factory=list)
+    exclude_repo: tuple[str, ...] = ()
 
     # Weighting options
     size_weight: float = 1.0
@@ -117,7 +134,7 @@ class LangsCardConfig(CardStyleConfig):
     stats_format: str = "percentages"  # "percentages" or "bytes"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserStatsFetchConfig(BaseConfig):
     """Configuration for fetching user stats data."""
 
@@ -125,21 +142,23 @@ class UserStatsFetchConfig(BaseConfig):
     token: str
     include_all_commits: bool = False
     commits_year: int | None = None
-    show: list[str] = field(default_factory=list)
+    show: tuple[str, ...] = ()
+    cache_ttl: int = 0  # seconds; 0 disables the on-disk response cache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LangsFetchConfig(BaseConfig):
     """Configuration for fetching language data."""
 
     username: str
     token: str
-    exclude_repo: list[str] = field(default_factory=list)
+    exclude_repo: tuple[str, ...] = ()
     size_weight: float = 1.0
     count_weight: float = 0.0
+    cache_ttl: int = 0  # seconds; 0 disables the on-disk response cache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContribCardConfig(CardStyleConfig):
     """Configuration for contributor card rendering."""
 
@@ -147,15 +166,16 @@ class ContribCardConfig(CardStyleConfig):
     card_width: int = 467
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContribFetchConfig(BaseConfig):
     """Configuration for fetching contributor data."""
 
     username: str
     token: str
     limit: int = 10
-    exclude_repo: list[str] = field(default_factory=list)
-    contribution_types: list[str] = field(default_factory=lambda: ["commits", "prs"])
+    exclude_repo: tuple[str, ...] = ()
+    contribution_types: tuple[str, ...] = ("commits", "prs")
+    cache_ttl: int = 0  # seconds; 0 disables the on-disk response cache
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -169,3 +189,17 @@ class ContribFetchConfig(BaseConfig):
                 raise ValueError(
                     f"Invalid contribution type '{c_type}'. Allowed: {', '.join(sorted(VALID_CONTRIB_TYPES))}"
                 )
+
+
+# Computed once at import rather than on every from_cli_args call
+for _config_cls in (
+    BaseConfig,
+    CardStyleConfig,
+    UserStatsCardConfig,
+    LangsCardConfig,
+    UserStatsFetchConfig,
+    LangsFetchConfig,
+    ContribCardConfig,
+    ContribFetchConfig,
+):
+    _config_cls._VALID_FIELDS = _field_names(_config_cls)
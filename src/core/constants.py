@@ -8,6 +8,19 @@ import os
 API_BASE_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")
 GRAPHQL_ENDPOINT = os.environ.get("GITHUB_GRAPHQL_URL", f"{API_BASE_URL}/graphql")
 API_TIMEOUT = 30
+# Connection attempts retried by the HTTP transport (connect errors only, never after a request was sent)
+API_CONNECT_RETRIES = 2
+# Connection pool size; the contributor card fans out one request per year and per avatar
+API_MAX_CONNECTIONS = 16
+# Largest avatar download accepted; GitHub avatars are a few KB, anything bigger is not an avatar
+AVATAR_MAX_BYTES = 256 * 1024
+# Below this many remaining API calls, wait for the rate-limit window to reset before sending more
+RATE_LIMIT_MIN_REMAINING = 10
+# Longest rate-limit wait (seconds) before sending anyway and letting GitHub answer
+RATE_LIMIT_MAX_WAIT = 60
+# Cache freshness (seconds) for contribution data of finished years; their counts no longer
+# change, only the repositories' star totals drift
+PAST_YEARS_CACHE_TTL = 7 * 24 * 3600
 
 # Card Dimensions
 CARD_PADDING = 25
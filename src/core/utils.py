@@ -1,10 +1,18 @@
 """Utility functions for formatting and data manipulation."""
 
 import fnmatch
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from html import escape as html_escape
 from typing import Any
 
 from .constants import NUMBER_FORMAT_THOUSAND_DIVISOR
 
+# Characters that must be escaped for XML/SVG
+_HTML_SPECIAL_RE = re.compile("[&<>\"']")
+
 
 def k_formatter(num: int, precision: int | None = None) -> str:
     """
@@ -25,29 +33,77 @@ def k_formatter(num: int, precision: int | None = None) -> str:
         >>> k_formatter(6626, precision=1)
         '6.6k'
     """
-    abs_num = abs(num)
-    sign = -1 if num < 0 else 1
-
     if precision is not None and 0 <= precision <= 2:
-        return f"{sign * abs_num / NUMBER_FORMAT_THOUSAND_DIVISOR:.{precision}f}k"
+        return f"{num / NUMBER_FORMAT_THOUSAND_DIVISOR:.{precision}f}k"
 
-    if abs_num < NUMBER_FORMAT_THOUSAND_DIVISOR:
-        return str(sign * abs_num)
+    if -NUMBER_FORMAT_THOUSAND_DIVISOR < num < NUMBER_FORMAT_THOUSAND_DIVISOR:
+        return str(num)
 
-    formatted = sign * round(abs_num / NUMBER_FORMAT_THOUSAND_DIVISOR, 1)
-    # Remove trailing .0
-    if formatted == int(formatted):
+    # round() is symmetric around zero, so the sign can stay on the value
+    formatted = round(num / NUMBER_FORMAT_THOUSAND_DIVISOR, 1)
+    # Remove trailing .0; ":g" would also do it but switches to exponent notation past 6 digits
+    if formatted.is_integer():
         return f"{int(formatted)}k"
     return f"{formatted}k"
 
 
-def is_repo_excluded(repo_name: str, exclude_patterns: list[str]) -> bool:
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledExcludes:
+    """Exclusion patterns split by match target, lowercased and compiled once."""
+
+    name_exact: frozenset[str]
+    name_re: re.Pattern[str] | None
+    full_exact: frozenset[str]
+    full_re: re.Pattern[str] | None
+
+    def matches(self, repo_name: str) -> bool:
+        """Return True if the lowercased repo name matches any pattern."""
+        if repo_name in self.full_exact or (self.full_re is not None and self.full_re.match(repo_name)):
+            return True
+        # Extract just the repo name part if repo_name is "owner/repo"
+        repo_name_only = repo_name.rpartition("/")[2]
+        return repo_name_only in self.name_exact or (
+            self.name_re is not None and self.name_re.match(repo_name_only) is not None
+        )
+
+
+def _compile_pattern_group(patterns: list[str]) -> tuple[frozenset[str], re.Pattern[str] | None]:
+    """Split patterns into plain names compared with == and one regex for the wildcard ones."""
+    exact = frozenset(p for p in patterns if _WILDCARD_CHARS.isdisjoint(p))
+    wild = [fnmatch.translate(p) for p in patterns if p not in exact]
+    return exact, re.compile("|".join(wild)) if wild else None
+
+
+@lru_cache(maxsize=64)
+def _compile_excludes(patterns: tuple[str, ...]) -> _CompiledExcludes:
+    """
+    Compile exclusion patterns for repeated matching.
+
+    Args:
+        patterns: Exclusion patterns as given by the user
+
+    Returns:
+        Matcher for repo-name-only and owner/repo patterns
+    """
+    lowered = [pattern.lower() for pattern in patterns]
+    name_exact, name_re = _compile_pattern_group([p for p in lowered if "/" not in p])
+    full_exact, full_re = _compile_pattern_group([p for p in lowered if "/" in p])
+    return _CompiledExcludes(name_exact, name_re, full_exact, full_re)
+
+
+def is_repo_excluded(repo_name: str, exclude_patterns: Iterable[str]) -> bool:
     """
     Check if a repository should be excluded based on patterns.
     Supports wildcards using fnmatch (e.g., "awesome-*").
     If the pattern does not contain a '/', it matches against the repo name only.
     Matching is case-insensitive.
 
+    The patterns are compiled once per distinct pattern set: plain names are
+    looked up in a set and wildcard patterns share one regex per match target.
+
     Args:
         repo_name: Repository name (e.g., "owner/repo" or "repo")
         exclude_patterns: List of exclusion patterns
@@ -55,21 +111,7 @@ def is_repo_excluded(repo_name: str, exclude_patterns: list[str]) -> bool:
     Returns:
         True if the repo matches any pattern
     """
-    repo_name = repo_name.lower()
-    # Extract just the repo name part if repo_name is "owner/repo"
-    repo_name_only = repo_name.split("/")[-1] if "/" in repo_name else repo_name
-
-    for pattern in exclude_patterns:
-        pattern = pattern.lower()
-        # If pattern has no '/', match against the repo name only
-        if "/" not in pattern:
-            if fnmatch.fnmatch(repo_name_only, pattern):
-                return True
-        else:
-            # If pattern has '/', match against the full provided repo_name
-            if fnmatch.fnmatch(repo_name, pattern):
-                return True
-    return False
+    return _compile_excludes(tuple(exclude_patterns)).matches(repo_name.lower())
 
 
 def clamp_value(value: float, min_val: float, max_val: float) -> float:
@@ -84,43 +126,54 @@ def clamp_value(value: float, min_val: float, max_val: float) -> float:
     Returns:
         Clamped value
     """
-    return max(min_val, min(value, max_val))
+    # Plain comparisons skip the two builtin calls of max(min_val, min(value, max_val))
+    if value > max_val:
+        value = max_val
+    if value < min_val:
+        return min_val
+    return value
 
 
+@lru_cache(maxsize=512)
 def encode_html(text: str) -> str:
     """
     Encode special HTML/XML characters for safe SVG embedding.
 
+    Results are memoized in a bounded LRU cache, since the same short
+    labels and titles are escaped repeatedly across cards.
+
     Args:
         text: Text to encode
 
     Returns:
         Encoded text safe for XML/SVG
     """
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    # Most labels contain nothing to escape; skip the substitution entirely for them
+    if _HTML_SPECIAL_RE.search(text) is None:
+        return text
+    # html.escape runs chained C-level replaces; keep the numeric apostrophe entity used in cards
+    return html_escape(text).replace("&#x27;", "&#39;")
 
 
-def parse_list_arg(arg: str | list[str] | None) -> list[str]:
+def parse_list_arg(arg: str | Iterable[str] | None) -> tuple[str, ...]:
     """
-    Parse a comma-separated string or list into a list of strings.
+    Parse a comma-separated string or sequence into a tuple of strings.
+
+    A tuple keeps the order of the items and, unlike a list, is immutable and
+    hashable, so parsed values can be stored on frozen configs.
 
     Args:
-        arg: Comma-separated string, list of strings, or None
+        arg: Comma-separated string, iterable of strings, or None
 
     Returns:
-        List of stripped strings
+        Tuple of stripped, non-empty strings
     """
     if arg is None:
-        return []
-    if isinstance(arg, list):
-        return [str(s).strip() for s in arg if str(s).strip()]
-    return [s.strip() for s in arg.split(",") if s.strip()]
+        return ()
+    # map/filter keep the strip-and-drop-empties loop in C and strip each item only once
+    if isinstance(arg, str):
+        return tuple(filter(None, map(str.strip, arg.split(","))))
+    return tuple(filter(None, map(str.strip, map(str, arg))))
 
 
 def flex_layout(items: list[dict[str, Any]], gap: int, direction: str = "column") -> str:
@@ -1,19 +1,138 @@
 """GitHub API client for making authenticated requests."""
 
 import asyncio
+import hashlib
+import ipaddress
+import json
+import re
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from importlib.util import find_spec
 from types import TracebackType
 from typing import Any, Self, cast
+from urllib.request import getproxies
 
 import httpx
 
-from ..core.constants import API_TIMEOUT, GRAPHQL_ENDPOINT
+from ..core.cache import ResponseCache
+from ..core.constants import (
+    API_BASE_URL,
+    API_CONNECT_RETRIES,
+    API_MAX_CONNECTIONS,
+    API_TIMEOUT,
+    AVATAR_MAX_BYTES,
+    GRAPHQL_ENDPOINT,
+    RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_MIN_REMAINING,
+)
 from ..core.exceptions import APIError
 
+# HTTP/2 multiplexes the contributor card's request burst over one connection; it needs the optional h2 package
+_HTTP2 = find_spec("h2") is not None
+_POOL_LIMITS = httpx.Limits(max_connections=API_MAX_CONNECTIONS, max_keepalive_connections=API_MAX_CONNECTIONS)
+
+
+def _env_proxies() -> dict[str, str | None]:
+    """
+    Proxy URL per httpx mount pattern from the *_PROXY / NO_PROXY environment variables.
+
+    httpx ignores these variables once a client is given an explicit transport, so
+    the clients mount their own proxied transports built from this mapping, using
+    the same rules httpx applies by default. NO_PROXY patterns map to None (direct).
+    """
+    proxies = getproxies()
+    mounts: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            mounts[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+
+    for hostname in proxies.get("no", "").split(","):
+        hostname = hostname.strip()
+        if not hostname:
+            continue
+        if hostname == "*":
+            # Proxies disabled for every host
+            return {}
+        if "://" in hostname:
+            mounts[hostname] = None
+        elif hostname.lower() == "localhost":
+            mounts[f"all://{hostname}"] = None
+        else:
+            try:
+                address = ipaddress.ip_address(hostname)
+            except ValueError:
+                # Domain suffix: matches the domain itself and its subdomains
+                mounts[f"all://*{hostname}"] = None
+            else:
+                mounts[f"all://[{hostname}]" if address.version == 6 else f"all://{hostname}"] = None
+    return mounts
+
+
+# Avatars are already compressed images, so ask for them without transfer compression
+_IMAGE_HEADERS = {"Accept": "image/*", "Accept-Encoding": "identity"}
+
+
+def _decode_json(response: httpx.Response) -> dict[str, Any]:
+    """Raise APIError for error responses, otherwise decode the JSON body."""
+    status = response.status_code
+    if status >= 400:
+        raise APIError(f"GitHub API request failed: HTTP {status}: {response.text[:200]}")
+    data: dict[str, Any] = response.json()
+    return data
+
+
+@lru_cache(maxsize=32)
+def _query_digest(query: str) -> str:
+    """SHA-256 of a GraphQL query; the queries are module constants, so each is hashed once."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+# GraphQL string literals (kept) and runs of whitespace and comments (collapsed to one space)
+_GRAPHQL_LEXEME_RE = re.compile(r'"(?:[^"\\]|\\.)*"|(?:\s|#[^\n]*)+')
+
+
+@lru_cache(maxsize=32)
+def _compact_query(query: str) -> str:
+    """Strip comments and indentation from a GraphQL query to shrink the request body."""
+    return _GRAPHQL_LEXEME_RE.sub(lambda m: m.group() if m.group().startswith('"') else " ", query).strip()
+
+
+def _response_etag(response: httpx.Response) -> str | None:
+    """ETag header of a response, if it sent one."""
+    etag = response.headers.get("ETag")
+    return etag if isinstance(etag, str) else None
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds to wait before retrying a rate-limited (403/429) response, capped at RATE_LIMIT_MAX_WAIT."""
+    if response.status_code not in (httpx.codes.FORBIDDEN, httpx.codes.TOO_MANY_REQUESTS):
+        return None
+    value = response.headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        return None
+    return min(max(delay, 0.0), RATE_LIMIT_MAX_WAIT)
+
+
+def _rest_resource(url: str) -> str:
+    """GitHub rate-limit resource a REST URL counts against."""
+    path = url.removeprefix(API_BASE_URL)
+    if path.startswith("/search/code"):
+        return "code_search"
+    if path.startswith("/search/"):
+        return "search"
+    return "core"
+
 
 class GitHubClient:
     """Helper client for GitHub API interactions."""
 
-    def __init__(self, token: str) -> None:
+    def __init__(self, token: str, cache_ttl: float = 0) -> None:
         self.token = token
         self.headers = {
             "Authorization": f"Bearer {token}",
@@ -23,19 +142,48 @@ class GitHubClient:
         self._client: httpx.Client | None = None
         self._async_client: httpx.AsyncClient | None = None
         self._close_tasks: set[asyncio.Task[Any]] = set()
+        # On-disk response cache; disabled unless a positive TTL (seconds) is given
+        self._cache = ResponseCache(cache_ttl) if cache_ttl > 0 else None
+        # Latest X-RateLimit-Remaining / X-RateLimit-Reset (epoch seconds) per rate-limit resource;
+        # GitHub limits core REST, search and GraphQL separately
+        self._rate_limits: dict[str, tuple[int, float]] = {}
 
     @property
     def client(self) -> httpx.Client:
         """Get or create synchronous HTTP client."""
         if self._client is None:
-            self._client = httpx.Client(timeout=self.timeout, follow_redirects=True)
+            self._client = httpx.Client(
+                timeout=self.timeout,
+                follow_redirects=True,
+                transport=httpx.HTTPTransport(retries=API_CONNECT_RETRIES, limits=_POOL_LIMITS, http2=_HTTP2),
+                mounts={
+                    pattern: httpx.HTTPTransport(
+                        proxy=url, retries=API_CONNECT_RETRIES, limits=_POOL_LIMITS, http2=_HTTP2
+                    )
+                    if url
+                    else None
+                    for pattern, url in _env_proxies().items()
+                },
+            )
         return self._client
 
     @property
     def async_client(self) -> httpx.AsyncClient:
         """Get or create asynchronous HTTP client."""
         if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                transport=httpx.AsyncHTTPTransport(retries=API_CONNECT_RETRIES, limits=_POOL_LIMITS, http2=_HTTP2),
+                mounts={
+                    pattern: httpx.AsyncHTTPTransport(
+                        proxy=url, retries=API_CONNECT_RETRIES, limits=_POOL_LIMITS, http2=_HTTP2
+                    )
+                    if url
+                    else None
+                    for pattern, url in _env_proxies().items()
+                },
+            )
         return self._async_client
 
     def close(self) -> None:
@@ -84,13 +232,127 @@ class GitHubClient:
     ) -> None:
         await self.aclose()
 
-    def graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+    def _cache_key(self, *parts: str) -> str | None:
+        """Build a response cache key scoped to this token, or None when caching is off."""
+        if self._cache is None:
+            return None
+        # The token is part of the key because private data visible to it differs per token
+        return ResponseCache.make_key(self.token, *parts)
+
+    def _cache_get(self, key: str | None, ttl: float | None = None) -> dict[str, Any] | None:
+        """Return a fresh cached response for *key*, if any (*ttl* overrides the cache TTL)."""
+        if key is None or self._cache is None:
+            return None
+        return cast(dict[str, Any] | None, self._cache.get(key, ttl))
+
+    def _cache_set(self, key: str | None, data: dict[str, Any], etag: str | None = None) -> None:
+        """Cache *data* under *key*, skipping GraphQL responses that carry errors."""
+        if key is not None and self._cache is not None and "errors" not in data:
+            self._cache.set(key, data, etag)
+
+    def _conditional_headers(self, key: str | None) -> dict[str, str]:
+        """If-None-Match header for revalidating an expired cache entry, if it has an ETag."""
+        if key is None or self._cache is None:
+            return {}
+        etag = self._cache.etag(key)
+        return {"If-None-Match": etag} if etag else {}
+
+    def _revalidated(self, key: str | None, response: httpx.Response) -> dict[str, Any] | None:
+        """Return the cached body if *response* is a 304 confirming it, else None."""
+        if key is None or self._cache is None or response.status_code != httpx.codes.NOT_MODIFIED:
+            return None
+        return cast(dict[str, Any] | None, self._cache.revalidate(key))
+
+    def _track_rate_limit(self, response: httpx.Response, resource: str) -> None:
+        """Remember the rate-limit budget reported by an API response sent to *resource*."""
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if not isinstance(remaining, str) or not isinstance(reset, str):
+            return
+        # Prefer the limit GitHub says it charged over the one inferred from the URL
+        reported = headers.get("X-RateLimit-Resource")
+        try:
+            self._rate_limits[reported if isinstance(reported, str) else resource] = (int(remaining), float(reset))
+        except ValueError:
+            return
+
+    def _rate_limit_wait(self, resource: str) -> float:
+        """Seconds to wait before calling *resource* so its rate limit is not exhausted."""
+        limit = self._rate_limits.get(resource)
+        if limit is None or limit[0] >= RATE_LIMIT_MIN_REMAINING:
+            return 0.0
+        return min(max(limit[1] - time.time(), 0.0), float(RATE_LIMIT_MAX_WAIT))
+
+    def _send_api(
+        self, send: Callable[[dict[str, str]], httpx.Response], extra_headers: dict[str, str], resource: str
+    ) -> httpx.Response:
+        """Send an API request, pacing it by *resource*'s rate limit and retrying once after Retry-After."""
+        wait = self._rate_limit_wait(resource)
+        if wait:
+            time.sleep(wait)
+        response = send(extra_headers)
+        self._track_rate_limit(response, resource)
+        delay = _retry_after(response)
+        if delay is not None:
+            time.sleep(delay)
+            response = send(extra_headers)
+            self._track_rate_limit(response, resource)
+        return response
+
+    async def _async_send_api(
+        self,
+        send: Callable[[dict[str, str]], Awaitable[httpx.Response]],
+        extra_headers: dict[str, str],
+        resource: str,
+    ) -> httpx.Response:
+        """Asynchronous counterpart of ``_send_api``."""
+        wait = self._rate_limit_wait(resource)
+        if wait:
+            await asyncio.sleep(wait)
+        response = await send(extra_headers)
+        self._track_rate_limit(response, resource)
+        delay = _retry_after(response)
+        if delay is not None:
+            await asyncio.sleep(delay)
+            response = await send(extra_headers)
+            self._track_rate_limit(response, resource)
+        return response
+
+    def _graphql_cache_key(self, query: str, variables: dict[str, Any] | None) -> str | None:
+        """Cache key for a GraphQL request (skips serializing variables when caching is off)."""
+        if self._cache is None:
+            return None
+        return self._cache_key(
+            "graphql", GRAPHQL_ENDPOINT, _query_digest(query), json.dumps(variables or {}, sort_keys=True)
+        )
+
+    def _rest_cache_key(self, url: str, headers: dict[str, str] | None) -> str | None:
+        """Cache key for a REST GET request."""
+        if self._cache is None:
+            return None
+        return self._cache_key("rest", url, json.dumps(headers or {}, sort_keys=True))
+
+    def _request_json(
+        self,
+        cache_key: str | None,
+        send: Callable[[dict[str, str]], httpx.Response],
+        conditional: bool = False,
+        cache_ttl: float | None = None,
+        resource: str = "core",
+    ) -> dict[str, Any]:
         """
-        Execute a GraphQL query (synchronous).
+        Serve a JSON request from the cache or send it, then cache the result.
 
         Args:
-            query: GraphQL query string
-            variables: Optional variables for the query
+            cache_key: Response cache key, or None when caching is off
+            send: Issues the HTTP request with the given extra headers; only called on a cache miss
+            conditional: Revalidate an expired entry with its ETag (REST only; a 304 is not
+                counted against the rate limit)
+            cache_ttl: How long a cached response stays fresh for this request, overriding
+                the client's TTL; ignored when caching is off
+            resource: GitHub rate-limit resource the request counts against ("core",
+                "search", "graphql", ...), used to pace it
 
         Returns:
             JSON response data
@@ -98,24 +360,94 @@ class GitHubClient:
         Raises:
             APIError: If API request fails
         """
+        cached = self._cache_get(cache_key, cache_ttl)
+        if cached is not None:
+            return cached
+
+        extra_headers = self._conditional_headers(cache_key) if conditional else {}
         try:
-            response = self.client.post(
-                GRAPHQL_ENDPOINT,
-                json={"query": query, "variables": variables or {}},
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+            response = self._send_api(send, extra_headers, resource)
+            if extra_headers:
+                revalidated = self._revalidated(cache_key, response)
+                if revalidated is not None:
+                    return revalidated
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    # The entry vanished since the ETag was read; fetch the body unconditionally
+                    response = self._send_api(send, {}, resource)
+            data = _decode_json(response)
         except httpx.HTTPError as e:
             raise APIError(f"GitHub API request failed: {e}") from e
 
-    async def async_graphql_query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+        self._cache_set(cache_key, data, _response_etag(response) if conditional else None)
+        return data
+
+    async def _async_request_json(
+        self,
+        cache_key: str | None,
+        send: Callable[[dict[str, str]], Awaitable[httpx.Response]],
+        conditional: bool = False,
+        cache_ttl: float | None = None,
+        resource: str = "core",
+    ) -> dict[str, Any]:
+        """Asynchronous counterpart of ``_request_json``."""
+        cached = self._cache_get(cache_key, cache_ttl)
+        if cached is not None:
+            return cached
+
+        extra_headers = self._conditional_headers(cache_key) if conditional else {}
+        try:
+            response = await self._async_send_api(send, extra_headers, resource)
+            if extra_headers:
+                revalidated = self._revalidated(cache_key, response)
+                if revalidated is not None:
+                    return revalidated
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    # The entry vanished since the ETag was read; fetch the body unconditionally
+                    response = await self._async_send_api(send, {}, resource)
+            data = _decode_json(response)
+        except httpx.HTTPError as e:
+            raise APIError(f"GitHub API request failed: {e}") from e
+
+        self._cache_set(cache_key, data, _response_etag(response) if conditional else None)
+        return data
+
+    def graphql_query(
+        self, query: str, variables: dict[str, Any] | None = None, cache_ttl: float | None = None
+    ) -> dict[str, Any]:
+        """
+        Execute a GraphQL query (synchronous).
+
+        Args:
+            query: GraphQL query string
+            variables: Optional variables for the query
+            cache_ttl: Optional cache freshness override in seconds, for responses that
+                change less often than the client's TTL assumes
+
+        Returns:
+            JSON response data
+
+        Raises:
+            APIError: If API request fails
+        """
+        payload = {"query": _compact_query(query), "variables": variables or {}}
+        return self._request_json(
+            self._graphql_cache_key(query, variables),
+            lambda _: self.client.post(GRAPHQL_ENDPOINT, json=payload, headers=self.headers),
+            cache_ttl=cache_ttl,
+            resource="graphql",
+        )
+
+    async def async_graphql_query(
+        self, query: str, variables: dict[str, Any] | None = None, cache_ttl: float | None = None
+    ) -> dict[str, Any]:
         """
         Execute a GraphQL query (asynchronous).
 
         Args:
             query: GraphQL query string
             variables: Optional variables for the query
+            cache_ttl: Optional cache freshness override in seconds, for responses that
+                change less often than the client's TTL assumes
 
         Returns:
             JSON response data
@@ -123,16 +455,13 @@ class GitHubClient:
         Raises:
             APIError: If API request fails
         """
-        try:
-            response = await self.async_client.post(
-                GRAPHQL_ENDPOINT,
-                json={"query": query, "variables": variables or {}},
-                headers=self.headers,
-            )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
-        except httpx.HTTPError as e:
-            raise APIError(f"GitHub API request failed: {e}") from e
+        payload = {"query": _compact_query(query), "variables": variables or {}}
+        return await self._async_request_json(
+            self._graphql_cache_key(query, variables),
+            lambda _: self.async_client.post(GRAPHQL_ENDPOINT, json=payload, headers=self.headers),
+            cache_ttl=cache_ttl,
+            resource="graphql",
+        )
 
     def rest_get(self, url: str, headers: dict[str, str] | None = None) -> dict[str, Any]:
         """
@@ -148,19 +477,14 @@ class GitHubClient:
         Raises:
             APIError: If API request fails
         """
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-
-        try:
-            response = self.client.get(
-                url,
-                headers=request_headers,
-            )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
-        except httpx.HTTPError as e:
-            raise APIError(f"GitHub API request failed: {e}") from e
+        # Only build a merged dict when the caller adds headers; the common case reuses self.headers
+        request_headers = {**self.headers, **headers} if headers else self.headers
+        return self._request_json(
+            self._rest_cache_key(url, headers),
+            lambda extra: self.client.get(url, headers={**request_headers, **extra} if extra else request_headers),
+            conditional=True,
+            resource=_rest_resource(url),
+        )
 
     async def async_rest_get(self, url: str, headers: dict[str, str] | None = None) -> dict[str, Any]:
         """
@@ -176,34 +500,40 @@ class GitHubClient:
         Raises:
             APIError: If API request fails
         """
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-
-        try:
-            response = await self.async_client.get(
-                url,
-                headers=request_headers,
-            )
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
-        except httpx.HTTPError as e:
-            raise APIError(f"GitHub API request failed: {e}") from e
+        # Only build a merged dict when the caller adds headers; the common case reuses self.headers
+        request_headers = {**self.headers, **headers} if headers else self.headers
+        return await self._async_request_json(
+            self._rest_cache_key(url, headers),
+            lambda extra: self.async_client.get(
+                url, headers={**request_headers, **extra} if extra else request_headers
+            ),
+            conditional=True,
+            resource=_rest_resource(url),
+        )
 
     def fetch_image(self, url: str) -> bytes | None:
         """
         Fetch an image from a URL (synchronous).
 
+        The body is streamed and the download abandoned once it exceeds
+        AVATAR_MAX_BYTES.
+
         Args:
             url: Image URL
 
         Returns:
-            Image binary content or None if failed
+            Image binary content or None if failed or too large
         """
         try:
-            response = self.client.get(url)
-            response.raise_for_status()
-            return response.content
+            with self.client.stream("GET", url, headers=_IMAGE_HEADERS) as response:
+                if response.status_code >= 400:
+                    return None
+                data = bytearray()
+                for chunk in response.iter_bytes():
+                    data += chunk
+                    if len(data) > AVATAR_MAX_BYTES:
+                        return None
+                return bytes(data)
         except httpx.HTTPError:
             return None
 
@@ -211,15 +541,24 @@ class GitHubClient:
         """
         Fetch an image from a URL (asynchronous).
 
+        The body is streamed and the download abandoned once it exceeds
+        AVATAR_MAX_BYTES.
+
         Args:
             url: Image URL
 
         Returns:
-            Image binary content or None if failed
+            Image binary content or None if failed or too large
         """
         try:
-            response = await self.async_client.get(url)
-            response.raise_for_status()
-            return response.content
+            async with self.async_client.stream("GET", url, headers=_IMAGE_HEADERS) as response:
+                if response.status_code >= 400:
+                    return None
+                data = bytearray()
+                async for chunk in response.aiter_bytes():
+                    data += chunk
+                    if len(data) > AVATAR_MAX_BYTES:
+                        return None
+                return bytes(data)
         except httpx.HTTPError:
             return None
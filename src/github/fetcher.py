@@ -2,11 +2,16 @@
 
 import asyncio
 import base64
-from typing import Any, TypedDict
+import heapq
+from collections.abc import Collection, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from operator import attrgetter, itemgetter
+from typing import Any, TypedDict, cast
 from urllib.parse import quote
 
 from ..core.config import ContribFetchConfig, UserStatsFetchConfig
-from ..core.constants import API_BASE_URL, VALID_CONTRIB_TYPES
+from ..core.constants import API_BASE_URL, PAST_YEARS_CACHE_TTL, VALID_CONTRIB_TYPES
 from ..core.exceptions import APIError, FetchError
 from ..core.utils import is_repo_excluded
 from .client import GitHubClient
@@ -26,6 +31,20 @@ class ContributorRepo(TypedDict):
     avatar_b64: str | None
 
 
+@dataclass(slots=True)
+class _RepoAccum:
+    """Contribution counts for one repository, accumulated across years."""
+
+    name: str  # owner/repo
+    stars: int
+    avatar_url: str | None
+    commits: int = 0
+    prs: int = 0
+    issues: int = 0
+    reviews: int = 0
+    total_repo_commits: int = 0
+
+
 class ContributorStats(TypedDict):
     """Contributor statistics."""
 
@@ -49,248 +68,263 @@ class UserStats(TypedDict):
     discussionsAnswered: int
 
 
-def fetch_user_stats(config: UserStatsFetchConfig) -> UserStats:
+# Star counts and cursor for one page of owned repositories.
+_REPO_STARS_PAGE_FIELDS = """
+      nodes {
+        stargazerCount
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+"""
+
+# $from/$to are nullable: when they are left out of the variables GitHub uses its default
+# range, so one query serves both the all-time card and a single commits year.
+_USER_QUERY = f"""
+query userInfo($login: String!, $withDiscussions: Boolean!, $from: DateTime, $to: DateTime) {{
+  user(login: $login) {{
+    contributionsCollection(from: $from, to: $to) {{
+      totalCommitContributions
+      totalPullRequestReviewContributions
+    }}
+    name
+    login
+    repositoriesContributedTo(
+      first: 1
+      includeUserRepositories: true
+      contributionTypes: [COMMIT, ISSUE, PULL_REQUEST, REPOSITORY]
+    ) {{
+      totalCount
+    }}
+    pullRequests(first: 1) {{
+      totalCount
+    }}
+    mergedPullRequests: pullRequests(states: MERGED) {{
+      totalCount
+    }}
+    issues {{
+      totalCount
+    }}
+    followers {{
+      totalCount
+    }}
+    repositoryDiscussions @include(if: $withDiscussions) {{
+      totalCount
+    }}
+    repositoryDiscussionComments(onlyAnswers: true) @include(if: $withDiscussions) {{
+      totalCount
+    }}
+    repositories(
+      first: 100
+      ownerAffiliations: OWNER
+      orderBy: {{direction: DESC, field: STARGAZERS}}
+    ) {{{_REPO_STARS_PAGE_FIELDS}    }}
+  }}
+}}
+"""
+
+_USER_REPOS_PAGE_QUERY = f"""
+query userRepos($login: String!, $after: String!) {{
+  user(login: $login) {{
+    repositories(
+      first: 100
+      after: $after
+      ownerAffiliations: OWNER
+      orderBy: {{direction: DESC, field: STARGAZERS}}
+    ) {{{_REPO_STARS_PAGE_FIELDS}    }}
+  }}
+}}
+"""
+
+
+def _ensure_no_running_loop(async_name: str) -> None:
     """
-    Fetch GitHub user statistics via GraphQL and REST APIs.
+    Refuse to start a nested event loop from a synchronous entry point.
 
     Args:
-        config: Fetch configuration
+        async_name: Name of the async variant to suggest instead
+
+    Raises:
+        FetchError: If an asyncio event loop is already running
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise FetchError(f"An asyncio event loop is already running. Please use `{async_name}` instead.")
+
+
+async def _async_search_total_count(
+    client: GitHubClient, url: str, headers: dict[str, str] | None = None
+) -> int | None:
+    """Run a REST search and return its ``total_count``, or None if the request fails."""
+    try:
+        data = await client.async_rest_get(url, headers=headers)
+    except APIError:
+        return None
+    total_count = data.get("total_count")
+    return total_count if isinstance(total_count, int) else None
+
+
+async def _async_fetch_user(client: GitHubClient, variables: dict[str, Any], username: str) -> dict[str, Any]:
+    """
+    Run the main user-stats query.
+
+    Args:
+        client: Authenticated GitHub API client
+        variables: Query variables
+        username: GitHub username, for error messages
 
     Returns:
-        Dictionary with user statistics
+        The ``user`` object from the response
 
     Raises:
-        FetchError: If API request fails
+        FetchError: If the request fails, returns GraphQL errors or the user does not exist
     """
-    with GitHubClient(config.token) as client:
-        username = config.username
-        include_all_commits = config.include_all_commits
-        commits_year = config.commits_year
-        show = config.show or []
+    try:
+        data = await client.async_graphql_query(_USER_QUERY, variables)
 
-        # Build date range for commits_year filter
-        from_date = None
-        to_date = None
-        if commits_year is not None:
-            from_date = f"{commits_year}-01-01T00:00:00Z"
-            to_date = f"{commits_year}-12-31T23:59:59Z"
+        if "errors" in data:
+            error_msg = data["errors"][0].get("message", "Unknown GraphQL error")
+            raise FetchError(f"GraphQL error: {error_msg}")
 
-        # GraphQL query with optional date range for commits
-        variables: dict[str, Any] = {"login": username}
-        if commits_year is not None:
-            query = """
-            query userInfo($login: String!, $from: DateTime!, $to: DateTime!) {
-              user(login: $login) {
-                name
-                login
-                contributionsCollection(from: $from, to: $to) {
-                  totalCommitContributions
-                  totalPullRequestReviewContributions
-                }
-                repositoriesContributedTo(
-                  first: 1
-                  includeUserRepositories: true
-                  contributionTypes: [COMMIT, ISSUE, PULL_REQUEST, REPOSITORY]
-                ) {
-                  totalCount
-                }
-                pullRequests(first: 1) {
-                  totalCount
-                }
-                mergedPullRequests: pullRequests(states: MERGED) {
-                  totalCount
-                }
-                openIssues: issues(states: OPEN) {
-                  totalCount
-                }
-                closedIssues: issues(states: CLOSED) {
-                  totalCount
-                }
-                followers {
-                  totalCount
-                }
-                repositories(
-                  first: 100
-                  ownerAffiliations: OWNER
-                  orderBy: {direction: DESC, field: STARGAZERS}
-                ) {
-                  nodes {
-                    stargazers {
-                      totalCount
-                    }
-                  }
-                  pageInfo {
-                    hasNextPage
-                    endCursor
-                  }
-                }
-              }
-            }
-            """
-            variables.update({"from": from_date, "to": to_date})
-        else:
-            query = """
-            query userInfo($login: String!) {
-              user(login: $login) {
-                name
-                login
-                contributionsCollection {
-                  totalCommitContributions
-                  totalPullRequestReviewContributions
-                }
-                repositoriesContributedTo(
-                  first: 1
-                  includeUserRepositories: true
-                  contributionTypes: [COMMIT, ISSUE, PULL_REQUEST, REPOSITORY]
-                ) {
-                  totalCount
-                }
-                pullRequests(first: 1) {
-                  totalCount
-                }
-                mergedPullRequests: pullRequests(states: MERGED) {
-                  totalCount
-                }
-                openIssues: issues(states: OPEN) {
-                  totalCount
-                }
-                closedIssues: issues(states: CLOSED) {
-                  totalCount
-                }
-                followers {
-                  totalCount
-                }
-                repositories(
-                  first: 100
-                  ownerAffiliations: OWNER
-                  orderBy: {direction: DESC, field: STARGAZERS}
-                ) {
-                  nodes {
-                    stargazers {
-                      totalCount
-                    }
-                  }
-                  pageInfo {
-                    hasNextPage
-                    endCursor
-                  }
-                }
-              }
-            }
-            """
+        user = data.get("data", {}).get("user")
+        if not user:
+            raise FetchError(f"User '{username}' not found")
 
-        # Execute GraphQL query
-        try:
-            data = client.graphql_query(query, variables)
-
-            if "errors" in data:
-                error_msg = data["errors"][0].get("message", "Unknown GraphQL error")
-                raise FetchError(f"GraphQL error: {error_msg}")
-
-            user = data.get("data", {}).get("user")
-            if not user:
-                raise FetchError(f"User '{username}' not found")
-
-        except APIError as e:
-            raise FetchError(f"Failed to fetch data from GitHub: {e}") from e
-
-        # Calculate total stars
-        total_stars = sum(repo["stargazers"]["totalCount"] for repo in user["repositories"]["nodes"])
-
-        # Handle pagination for repositories if needed
-        has_next_page = user["repositories"]["pageInfo"]["hasNextPage"]
-        end_cursor = user["repositories"]["pageInfo"]["endCursor"]
-
-        while has_next_page:
-            pagination_query = """
-            query userRepos($login: String!, $after: String!) {
-              user(login: $login) {
-                repositories(
-                  first: 100
-                  after: $after
-                  ownerAffiliations: OWNER
-                  orderBy: {direction: DESC, field: STARGAZERS}
-                ) {
-                  nodes {
-                    stargazers {
-                      totalCount
-                    }
-                  }
-                  pageInfo {
-                    hasNextPage
-                    endCursor
-                  }
-                }
-              }
-            }
-            """
+    except APIError as e:
+        raise FetchError(f"Failed to fetch data from GitHub: {e}") from e
 
-            try:
-                page_data = client.graphql_query(pagination_query, {"login": username, "after": end_cursor})
+    return cast(dict[str, Any], user)
 
-                page_user = page_data.get("data", {}).get("user")
-                if page_user:
-                    total_stars += sum(repo["stargazers"]["totalCount"] for repo in page_user["repositories"]["nodes"])
-                    has_next_page = page_user["repositories"]["pageInfo"]["hasNextPage"]
-                    end_cursor = page_user["repositories"]["pageInfo"]["endCursor"]
-                else:
-                    break
 
-            except APIError:
-                # If pagination fails, continue with what we have
-                break
+def _has_more_stars(repositories: dict[str, Any]) -> bool:
+    """
+    Tell whether another repositories page could still add stars.
 
-        # Get total commits
-        total_commits = user["contributionsCollection"]["totalCommitContributions"]
+    Pages are ordered by stargazers descending, so once a page ends with an
+    unstarred repository every later page is unstarred too.
 
-        if include_all_commits:
-            # Use REST API to get all-time commit count
-            try:
-                search_data = client.rest_get(
-                    f"{API_BASE_URL}/search/commits?q=author:{quote(username)}",
-                    headers={"Accept": "application/vnd.github.cloak-preview+json"},
-                )
-                total_commits = search_data.get("total_count", total_commits)
-            except APIError:
-                # If REST API fails, use GraphQL data
-                pass
+    Args:
+        repositories: One ``repositories`` page from a user query
+
+    Returns:
+        True if the next page should be fetched
+    """
+    nodes = repositories["nodes"]
+    return bool(repositories["pageInfo"]["hasNextPage"] and nodes and nodes[-1]["stargazerCount"] > 0)
+
+
+async def _async_fetch_total_stars(client: GitHubClient, username: str, repositories: dict[str, Any]) -> int:
+    """
+    Sum stargazers over all owned repositories, following pagination.
+
+    Args:
+        client: Authenticated GitHub API client
+        username: GitHub username
+        repositories: First ``repositories`` page from the main user query
+
+    Returns:
+        Total star count; pages after a failed request are skipped
+    """
+    get_stars = itemgetter("stargazerCount")
+    total_stars: int = sum(map(get_stars, repositories["nodes"]))
+
+    # Handle pagination for repositories if needed
+    has_next_page = _has_more_stars(repositories)
+    end_cursor = repositories["pageInfo"]["endCursor"]
 
-        # Use REST API to get accurate issue count (includes issues in repos user doesn't own)
-        total_issues = user["openIssues"]["totalCount"] + user["closedIssues"]["totalCount"]
+    while has_next_page:
         try:
-            issues_data = client.rest_get(f"{API_BASE_URL}/search/issues?q=author:{quote(username)}+type:issue")
-            total_issues = issues_data.get("total_count", total_issues)
+            page_data = await client.async_graphql_query(
+                _USER_REPOS_PAGE_QUERY, {"login": username, "after": end_cursor}
+            )
+
+            page_user = page_data.get("data", {}).get("user")
+            if page_user:
+                total_stars += sum(map(get_stars, page_user["repositories"]["nodes"]))
+                has_next_page = _has_more_stars(page_user["repositories"])
+                end_cursor = page_user["repositories"]["pageInfo"]["endCursor"]
+            else:
+                break
+
         except APIError:
-            # If REST API fails, use GraphQL data
-            pass
-
-        # Fetch additional stats if requested
-        discussions_started = 0
-        discussions_answered = 0
-
-        if "discussions_started" in show or "discussions_answered" in show:
-            discussions_query = """
-            query userDiscussions($login: String!) {
-              user(login: $login) {
-                repositoryDiscussions {
-                  totalCount
-                }
-                repositoryDiscussionComments(onlyAnswers: true) {
-                  totalCount
-                }
-              }
-            }
-            """
+            # If pagination fails, continue with what we have
+            break
+
+    return total_stars
 
-            try:
-                disc_data = client.graphql_query(discussions_query, {"login": username})
-                disc_user = disc_data.get("data", {}).get("user", {})
 
-                discussions_started = disc_user.get("repositoryDiscussions", {}).get("totalCount", 0)
-                discussions_answered = disc_user.get("repositoryDiscussionComments", {}).get("totalCount", 0)
-            except APIError:
-                # If discussions query fails, continue with zeros
-                pass
+async def _async_none() -> None:
+    """Placeholder awaitable for optional requests that are skipped."""
+    return None
+
+
+async def async_fetch_user_stats(config: UserStatsFetchConfig) -> UserStats:
+    """
+    Fetch GitHub user statistics via GraphQL and REST APIs (asynchronous).
+
+    The commit and issue searches do not depend on the main query, so they
+    run concurrently with it and with star pagination.
+
+    Args:
+        config: Fetch configuration
+
+    Returns:
+        Dictionary with user statistics
+
+    Raises:
+        FetchError: If API request fails
+    """
+    async with GitHubClient(config.token, cache_ttl=config.cache_ttl) as client:
+        username = config.username
+        include_all_commits = config.include_all_commits
+        commits_year = config.commits_year
+        show = config.show or ()
+
+        # GraphQL query with optional date range for commits
+        # Discussion counts ride along in the main query instead of a separate round-trip
+        with_discussions = "discussions_started" in show or "discussions_answered" in show
+        variables: dict[str, Any] = {"login": username, "withDiscussions": with_discussions}
+        if commits_year is not None:
+            variables["from"] = f"{commits_year}-01-01T00:00:00Z"
+            variables["to"] = f"{commits_year}-12-31T23:59:59Z"
+
+        commits_request = (
+            _async_search_total_count(
+                client,
+                f"{API_BASE_URL}/search/commits?q=author:{quote(username)}",
+                headers={"Accept": "application/vnd.github.cloak-preview+json"},
+            )
+            if include_all_commits
+            else _async_none()
+        )
+        # REST search gives an accurate issue count (includes issues in repos user doesn't own)
+        issues_request = _async_search_total_count(
+            client, f"{API_BASE_URL}/search/issues?q=author:{quote(username)}+type:issue"
+        )
+        # The REST searches do not need the main query's result,
+        # so they start now and overlap with it and with star pagination
+        side_requests = asyncio.gather(commits_request, issues_request)
+
+        try:
+            user = await _async_fetch_user(client, variables, username)
+        except BaseException:
+            # Cancel the searches and reap them so no orphaned task outlives the client
+            side_requests.cancel()
+            await asyncio.gather(side_requests, return_exceptions=True)
+            raise
+
+        total_stars, (searched_commits, searched_issues) = await asyncio.gather(
+            _async_fetch_total_stars(client, username, user["repositories"]), side_requests
+        )
+
+        # Fall back to GraphQL data where a REST search failed or was skipped
+        total_commits = user["contributionsCollection"]["totalCommitContributions"]
+        if searched_commits is not None:
+            total_commits = searched_commits
+        total_issues = user["issues"]["totalCount"] if searched_issues is None else searched_issues
 
         return {
             "name": user["name"] or user["login"],
@@ -303,11 +337,28 @@ def fetch_user_stats(config: UserStatsFetchConfig) -> UserStats:
             "contributedTo": user["repositoriesContributedTo"]["totalCount"],
             "followers": user["followers"]["totalCount"],
             "totalReviews": user["contributionsCollection"]["totalPullRequestReviewContributions"],
-            "discussionsStarted": discussions_started,
-            "discussionsAnswered": discussions_answered,
+            "discussionsStarted": (user.get("repositoryDiscussions") or {}).get("totalCount", 0),
+            "discussionsAnswered": (user.get("repositoryDiscussionComments") or {}).get("totalCount", 0),
         }
 
 
+def fetch_user_stats(config: UserStatsFetchConfig) -> UserStats:
+    """
+    Fetch GitHub user statistics via GraphQL and REST APIs.
+
+    Args:
+        config: Fetch configuration
+
+    Returns:
+        Dictionary with user statistics
+
+    Raises:
+        FetchError: If API request fails or if called from within an existing event loop.
+    """
+    _ensure_no_running_loop("async_fetch_user_stats")
+    return asyncio.run(async_fetch_user_stats(config))
+
+
 _CONTRIB_YEARS_QUERY = """
 query userYears($login: String!) {
   user(login: $login) {
@@ -318,31 +369,45 @@ query userYears($login: String!) {
 }
 """
 
-# Shared fragment for repository details.
+# Repository details shared by every contribution type, sent once as a named fragment.
 _REPO_DETAILS_FRAGMENT = """
-  repository {
-    nameWithOwner
-    isPrivate
-    owner {
-      login
-      avatarUrl
-    }
-    stargazers {
-      totalCount
-    }
-    object(expression: "HEAD") {
-      ... on Commit {
-        history {
-          totalCount
-        }
+fragment RepoDetails on Repository {
+  nameWithOwner
+  isPrivate
+  owner {
+    login
+    avatarUrl
+  }
+  stargazers {
+    totalCount
+  }
+  object(expression: "HEAD") {
+    ... on Commit {
+      history {
+        totalCount
       }
     }
   }
+}
 """
 
 
-def _build_contrib_query(contribution_types: list[str]) -> str:
-    """Build the GraphQL query dynamically based on requested contribution types."""
+# GraphQL connection name and ContributorRepo counter for each contribution type
+_CONTRIB_TYPE_KEYS = (
+    ("commitContributionsByRepository", "commits"),
+    ("pullRequestContributionsByRepository", "prs"),
+    ("issueContributionsByRepository", "issues"),
+    ("pullRequestReviewContributionsByRepository", "reviews"),
+)
+_COUNTED_PR_STATES = frozenset(("OPEN", "MERGED"))
+
+
+def _build_contrib_query(contribution_types: Collection[str], years: Sequence[int]) -> str:
+    """Build one GraphQL query for the requested contribution types across all *years*.
+
+    Each year is an aliased ``user`` field (``y2024``, ``y2023``, ...) with its own
+    date-range variables (``$from2024``/``$to2024``), so every year travels in a single request.
+    """
     if not contribution_types:
         msg = "contribution_types must not be empty"
         raise ValueError(msg)
@@ -357,48 +422,54 @@ def _build_contrib_query(contribution_types: list[str]) -> str:
     fragments = []
 
     if "commits" in contribution_types:
-        fragments.append(f"""
-      commitContributionsByRepository(maxRepositories: 100) {{
-        {_REPO_DETAILS_FRAGMENT}
-        contributions {{ totalCount }}
-      }}""")
+        fragments.append("""
+      commitContributionsByRepository(maxRepositories: 100) {
+        repository { ...RepoDetails }
+        contributions { totalCount }
+      }""")
     if "prs" in contribution_types:
         # For PRs, we need nodes to check their state (OPEN/MERGED)
-        fragments.append(f"""
-      pullRequestContributionsByRepository(maxRepositories: 100) {{
-        {_REPO_DETAILS_FRAGMENT}
-        contributions(first: 100) {{  # NOTE: repos with >100 PRs/year will be undercounted
-          nodes {{
-            pullRequest {{
+        fragments.append("""
+      pullRequestContributionsByRepository(maxRepositories: 100) {
+        repository { ...RepoDetails }
+        contributions(first: 100) {  # NOTE: repos with >100 PRs/year will be undercounted
+          nodes {
+            pullRequest {
               state
-            }}
-          }}
-        }}
-      }}""")
+            }
+          }
+        }
+      }""")
     if "issues" in contribution_types:
-        fragments.append(f"""
-      issueContributionsByRepository(maxRepositories: 100) {{
-        {_REPO_DETAILS_FRAGMENT}
-        contributions {{ totalCount }}
-      }}""")
+        fragments.append("""
+      issueContributionsByRepository(maxRepositories: 100) {
+        repository { ...RepoDetails }
+        contributions { totalCount }
+      }""")
     if "reviews" in contribution_types:
-        fragments.append(f"""
-      pullRequestReviewContributionsByRepository(maxRepositories: 100) {{
-        {_REPO_DETAILS_FRAGMENT}
-        contributions {{ totalCount }}
-      }}""")
+        fragments.append("""
+      pullRequestReviewContributionsByRepository(maxRepositories: 100) {
+        repository { ...RepoDetails }
+        contributions { totalCount }
+      }""")
 
     joined_fragments = "\n".join(fragments)
 
-    return f"""
-query userContribs($login: String!, $from: DateTime!, $to: DateTime!) {{
-  user(login: $login) {{
-    contributionsCollection(from: $from, to: $to) {{
+    params = "".join(f", $from{year}: DateTime!, $to{year}: DateTime!" for year in years)
+    year_fields = "".join(
+        f"""
+  y{year}: user(login: $login) {{
+    contributionsCollection(from: $from{year}, to: $to{year}) {{
 {joined_fragments}
     }}
-  }}
+  }}"""
+        for year in years
+    )
+
+    return f"""
+query userContribs($login: String!{params}) {{{year_fields}
 }}
-"""
+{_REPO_DETAILS_FRAGMENT}"""
 
 
 async def _async_fetch_contribution_years(client: GitHubClient, username: str) -> list[int]:
@@ -430,111 +501,152 @@ async def _async_fetch_contribution_years(client: GitHubClient, username: str) -
     return sorted(years, reverse=True)[:5]
 
 
-async def _async_process_year_contributions(
+async def _async_fetch_year_contributions(
     client: GitHubClient,
     username: str,
-    year: int,
-    raw_repos_map: dict[str, dict[str, Any]],
-    lock: asyncio.Lock,
-    contribution_types: list[str],
-) -> None:
-    """Fetch and merge one year's contribution data into *raw_repos_map* asynchronously.
-
-    The map is mutated in-place with lock protection.
+    years: Sequence[int],
+    contribution_types: Collection[str],
+    cache_ttl: float | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Fetch the contributions collections of all *years* in one batched query.
 
     Args:
         client: Authenticated GitHub API client
         username: GitHub username
-        year: Calendar year to fetch
-        raw_repos_map: Mutable accumulator mapping ``nameWithOwner`` to repo data
-        lock: Asyncio lock for raw_repos_map protection
+        years: Calendar years to fetch
         contribution_types: List of contribution types to fetch
+        cache_ttl: Optional response cache freshness override in seconds
+
+    Returns:
+        ``contributionsCollection`` by year for the years that resolved; years that
+        failed (null in a partial GraphQL response) or a failed request yield nothing
     """
-    from_date = f"{year}-01-01T00:00:00Z"
-    to_date = f"{year}-12-31T23:59:59Z"
+    if not years:
+        return {}
 
-    query = _build_contrib_query(contribution_types)
+    variables: dict[str, Any] = {"login": username}
+    for year in years:
+        variables[f"from{year}"] = f"{year}-01-01T00:00:00Z"
+        variables[f"to{year}"] = f"{year}-12-31T23:59:59Z"
 
     try:
         c_data = await client.async_graphql_query(
-            query,
-            {"login": username, "from": from_date, "to": to_date},
+            _build_contrib_query(contribution_types, years), variables, cache_ttl=cache_ttl
         )
+    except APIError:
+        return {}
+
+    # A failing year only nulls its own alias, so keep whatever else resolved
+    data = c_data.get("data") or {}
+    collections = {}
+    for year in years:
+        collection = (data.get(f"y{year}") or {}).get("contributionsCollection")
+        if collection:
+            collections[year] = collection
+    return collections
+
+
+async def _async_fetch_contributions(
+    client: GitHubClient, config: ContribFetchConfig, years: Sequence[int]
+) -> list[dict[str, Any]]:
+    """Fetch the contributions collections of *years*, most recent first.
 
-        if "errors" in c_data:
-            return
+    With the response cache on, finished years are fetched in a separate batch
+    cached for PAST_YEARS_CACHE_TTL, so routine runs only re-query the current year.
 
-        collection = c_data.get("data", {}).get("user", {}).get("contributionsCollection")
-        if not collection:
-            return
+    Args:
+        client: Authenticated GitHub API client
+        config: Contributor fetch configuration
+        years: Calendar years to fetch
+
+    Returns:
+        One ``contributionsCollection`` per year that resolved, in *years* order
+    """
+    if config.cache_ttl > 0:
+        current_year = datetime.now(UTC).year
+        batches = await asyncio.gather(
+            _async_fetch_year_contributions(
+                client, config.username, [y for y in years if y >= current_year], config.contribution_types
+            ),
+            _async_fetch_year_contributions(
+                client,
+                config.username,
+                [y for y in years if y < current_year],
+                config.contribution_types,
+                cache_ttl=max(config.cache_ttl, PAST_YEARS_CACHE_TTL),
+            ),
+        )
+        by_year = {**batches[0], **batches[1]}
+    else:
+        by_year = await _async_fetch_year_contributions(client, config.username, years, config.contribution_types)
+    return [by_year[year] for year in years if year in by_year]
 
-        all_contrib_types = [
-            ("commitContributionsByRepository", "commits"),
-            ("pullRequestContributionsByRepository", "prs"),
-            ("issueContributionsByRepository", "issues"),
-            ("pullRequestReviewContributionsByRepository", "reviews"),
-        ]
 
+def _merge_year_contributions(
+    collection: dict[str, Any],
+    username_lower: str,
+    raw_repos_map: dict[str, _RepoAccum],
+    contribution_types: Collection[str],
+) -> None:
+    """Merge one year's contribution data into *raw_repos_map* in place.
+
+    Args:
+        collection: ``contributionsCollection`` for one year
+        username_lower: Lowercased GitHub username (own repositories are skipped)
+        raw_repos_map: Mutable accumulator mapping ``nameWithOwner`` to repo data
+        contribution_types: List of contribution types that were fetched
+    """
+    for gh_key, stats_key in _CONTRIB_TYPE_KEYS:
         # Only process the types that were requested
-        active_contrib_types = [
-            (gh_key, stats_key) for gh_key, stats_key in all_contrib_types if stats_key in contribution_types
-        ]
-
-        for gh_key, stats_key in active_contrib_types:
-            for item in collection.get(gh_key, []):
-                repo = item["repository"]
-
-                if gh_key == "pullRequestContributionsByRepository":
-                    # Filter PRs by state: only OPEN and MERGED are considered contributions
-                    nodes = item.get("contributions", {}).get("nodes", [])
-                    count = sum(1 for node in nodes if node.get("pullRequest", {}).get("state") in ["OPEN", "MERGED"])
-                else:
-                    count = item["contributions"]["totalCount"]
-
-                if count == 0 or repo["isPrivate"]:
-                    continue
-                if repo["owner"]["login"].lower() == username.lower():
-                    continue
-
-                name = repo["nameWithOwner"]
-
-                async with lock:
-                    if name not in raw_repos_map:
-                        total_repo_commits = 0
-                        obj = repo.get("object")
-                        if obj and "history" in obj:
-                            total_repo_commits = obj["history"]["totalCount"]
-
-                        raw_repos_map[name] = {
-                            "name": name,
-                            "stars": repo["stargazers"]["totalCount"],
-                            "avatar_url": repo["owner"]["avatarUrl"],
-                            "commits": 0,
-                            "prs": 0,
-                            "issues": 0,
-                            "reviews": 0,
-                            "total_repo_commits": total_repo_commits,
-                        }
-                    else:
-                        if raw_repos_map[name]["total_repo_commits"] == 0:
-                            obj = repo.get("object")
-                            if obj and "history" in obj:
-                                raw_repos_map[name]["total_repo_commits"] = obj["history"]["totalCount"]
-
-                    raw_repos_map[name][stats_key] += count
+        if stats_key not in contribution_types:
+            continue
+        for item in collection.get(gh_key, []):
+            repo = item["repository"]
+
+            if gh_key == "pullRequestContributionsByRepository":
+                # Filter PRs by state: only OPEN and MERGED are considered contributions
+                nodes = item.get("contributions", {}).get("nodes", [])
+                count = sum(1 for node in nodes if node.get("pullRequest", {}).get("state") in _COUNTED_PR_STATES)
+            else:
+                count = item["contributions"]["totalCount"]
+
+            if count == 0 or repo["isPrivate"]:
+                continue
+            owner = repo["owner"]
+            if owner["login"].lower() == username_lower:
+                continue
+
+            name = repo["nameWithOwner"]
+            entry = raw_repos_map.get(name)
+
+            if entry is None:
+                total_repo_commits = 0
+                obj = repo.get("object")
+                if obj and "history" in obj:
+                    total_repo_commits = obj["history"]["totalCount"]
+
+                entry = _RepoAccum(
+                    name=name,
+                    stars=repo["stargazers"]["totalCount"],
+                    avatar_url=owner["avatarUrl"],
+                    total_repo_commits=total_repo_commits,
+                )
+                raw_repos_map[name] = entry
+            elif entry.total_repo_commits == 0:
+                obj = repo.get("object")
+                if obj and "history" in obj:
+                    entry.total_repo_commits = obj["history"]["totalCount"]
 
-    except APIError:
-        # Continue to next year on error
-        return
+            setattr(entry, stats_key, getattr(entry, stats_key) + count)
 
 
 async def _async_build_contributor_repos(
     client: GitHubClient,
-    raw_repos_map: dict[str, dict[str, Any]],
-    exclude_repo: list[str],
+    raw_repos_map: dict[str, _RepoAccum],
+    exclude_repo: Iterable[str],
     limit: int,
 ) -> list[ContributorRepo]:
-    """Rank, filter, sort, slice and enrich raw repo data asynchronously.
+    """Filter, sort, slice, rank and enrich raw repo data asynchronously.
 
     Args:
         client: Authenticated GitHub API client (for avatar fetching)
@@ -545,56 +657,42 @@ async def _async_build_contributor_repos(
     Returns:
         Final list of ``ContributorRepo`` dicts ready for rendering
     """
-    # Calculate ranks
-    repos_data: list[dict[str, Any]] = []
-    for repo_data in raw_repos_map.values():
-        repo_data["rank_level"] = calculate_repo_rank(repo_data["stars"], repo_data["total_repo_commits"])
-        repos_data.append(repo_data)
-
-    # Filter excluded repos
-    repos_data = [r for r in repos_data if not is_repo_excluded(r["name"], exclude_repo)]
-
-    # Sort by stars descending and limit
-    repos_data.sort(key=lambda r: r["stars"], reverse=True)
-    repos_data = repos_data[:limit]
-
-    # Fetch avatars asynchronously
-    async def fetch_avatar(repo: dict[str, Any]) -> ContributorRepo:
-        avatar_b64 = None
-        if repo["avatar_url"]:
-            image_data = await client.async_fetch_image(repo["avatar_url"])
-            if image_data:
-                avatar_b64 = base64.b64encode(image_data).decode("utf-8")
+    # Filter excluded repos, then keep the most starred (ties keep insertion order)
+    candidates = (r for r in raw_repos_map.values() if not is_repo_excluded(r.name, exclude_repo))
+    repos_data = heapq.nlargest(limit, candidates, key=attrgetter("stars"))
+
+    # Repos of the same owner share one avatar: download each URL once, concurrently
+    avatar_urls = list(dict.fromkeys(repo.avatar_url for repo in repos_data if repo.avatar_url))
+    images = await asyncio.gather(*(client.async_fetch_image(url) for url in avatar_urls))
+    avatars = {
+        url: base64.b64encode(image).decode("ascii") for url, image in zip(avatar_urls, images, strict=True) if image
+    }
 
-        return {
-            "name": repo["name"],
-            "stars": repo["stars"],
-            "commits": repo["commits"],
-            "prs": repo["prs"],
-            "issues": repo["issues"],
-            "reviews": repo["reviews"],
-            "rank_level": repo["rank_level"],
-            "avatar_b64": avatar_b64,
+    return [
+        {
+            "name": repo.name,
+            "stars": repo.stars,
+            "commits": repo.commits,
+            "prs": repo.prs,
+            "issues": repo.issues,
+            "reviews": repo.reviews,
+            "rank_level": calculate_repo_rank(repo.stars, repo.total_repo_commits),
+            "avatar_b64": avatars.get(repo.avatar_url) if repo.avatar_url else None,
         }
-
-    tasks = [fetch_avatar(repo) for repo in repos_data]
-    return await asyncio.gather(*tasks)
+        for repo in repos_data
+    ]
 
 
 async def async_fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
     """Async implementation of fetch_contributor_stats."""
-    async with GitHubClient(config.token) as client:
+    async with GitHubClient(config.token, cache_ttl=config.cache_ttl) as client:
         years = await _async_fetch_contribution_years(client, config.username)
 
-        raw_repos_map: dict[str, dict[str, Any]] = {}
-        lock = asyncio.Lock()
-        tasks = [
-            _async_process_year_contributions(
-                client, config.username, year, raw_repos_map, lock, config.contribution_types
-            )
-            for year in years
-        ]
-        await asyncio.gather(*tasks)
+        raw_repos_map: dict[str, _RepoAccum] = {}
+        collections = await _async_fetch_contributions(client, config, years)
+        username_lower = config.username.lower()
+        for collection in collections:
+            _merge_year_contributions(collection, username_lower, raw_repos_map, config.contribution_types)
 
         repos = await _async_build_contributor_repos(client, raw_repos_map, config.exclude_repo, config.limit)
 
@@ -614,15 +712,5 @@ def fetch_contributor_stats(config: ContribFetchConfig) -> ContributorStats:
     Raises:
         FetchError: If API request fails or if called from within an existing event loop.
     """
-    try:
-        asyncio.get_running_loop()
-        has_loop = True
-    except RuntimeError:
-        has_loop = False
-
-    if has_loop:
-        raise FetchError(
-            "An asyncio event loop is already running. Please use `async_fetch_contributor_stats` instead."
-        )
-
+    _ensure_no_running_loop("async_fetch_contributor_stats")
     return asyncio.run(async_fetch_contributor_stats(config))
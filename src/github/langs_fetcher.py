@@ -1,6 +1,7 @@
 """GitHub API client for fetching language statistics."""
 
 from dataclasses import dataclass
+from operator import attrgetter
 
 from ..core.config import LangsFetchConfig
 from ..core.constants import DEFAULT_LANG_COLOR
@@ -9,7 +10,7 @@ from ..core.utils import is_repo_excluded
 from .client import GitHubClient
 
 
-@dataclass
+@dataclass(slots=True)
 class Language:
     """Represents a programming language with its statistics."""
 
@@ -20,7 +21,7 @@ class Language:
     score: int = 0  # weighted score for ranking (set after aggregation)
 
 
-def fetch_top_languages(config: LangsFetchConfig) -> dict[str, Language]:
+def fetch_top_languages(config: LangsFetchConfig) -> list[Language]:
     """
     Fetch top programming languages for a GitHub user.
 
@@ -28,14 +29,14 @@ def fetch_top_languages(config: LangsFetchConfig) -> dict[str, Language]:
         config: Language fetch configuration
 
     Returns:
-        Dictionary mapping language name to Language object, sorted by size descending
+        Languages sorted by weighted score descending
 
     Raises:
         LanguageFetchError: If API request fails or returns errors
     """
-    with GitHubClient(config.token) as client:
+    with GitHubClient(config.token, cache_ttl=config.cache_ttl) as client:
         username = config.username
-        exclude_repo = config.exclude_repo or []
+        exclude_repo = config.exclude_repo or ()
         size_weight = config.size_weight
         count_weight = config.count_weight
 
@@ -113,25 +114,28 @@ def fetch_top_languages(config: LangsFetchConfig) -> dict[str, Language]:
                 if not lang_name:
                     continue
 
-                lang_color = node.get("color") or DEFAULT_LANG_COLOR
                 lang_size = edge.get("size", 0)
 
-                if lang_name in languages:
-                    languages[lang_name].size += lang_size
-                    languages[lang_name].count += 1
-                else:
+                lang = languages.get(lang_name)
+                if lang is None:
                     languages[lang_name] = Language(
                         name=lang_name,
-                        color=lang_color,
+                        color=node.get("color") or DEFAULT_LANG_COLOR,
                         size=lang_size,
                         count=1,
                     )
+                else:
+                    lang.size += lang_size
+                    lang.count += 1
 
         # Compute weighted score for ranking (size is preserved as original bytes)
-        for lang in languages.values():
-            lang.score = int((lang.size**size_weight) * (lang.count**count_weight))
+        if size_weight == 1 and count_weight == 0:
+            # Default weights: the score is the byte size itself
+            for lang in languages.values():
+                lang.score = lang.size
+        else:
+            for lang in languages.values():
+                lang.score = int((lang.size**size_weight) * (lang.count**count_weight))
 
         # Sort by score descending
-        sorted_langs = dict(sorted(languages.items(), key=lambda x: x[1].score, reverse=True))
-
-        return sorted_langs
+        return sorted(languages.values(), key=attrgetter("score"), reverse=True)
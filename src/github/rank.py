@@ -1,7 +1,30 @@
 """Rank calculation algorithm for GitHub stats."""
 
+from bisect import bisect_left
+from math import exp2
 from typing import TypedDict
 
+# User rank weights, and reciprocal medians that normalize each statistic before its CDF
+_COMMITS_WEIGHT = 2
+_INV_COMMITS_MEDIAN_ALL = 1 / 1000  # all-time commits
+_INV_COMMITS_MEDIAN_YEAR = 1 / 250  # current-year commits
+_PRS_WEIGHT, _INV_PRS_MEDIAN = 3, 1 / 50
+_ISSUES_WEIGHT, _INV_ISSUES_MEDIAN = 1, 1 / 25
+_REVIEWS_WEIGHT, _INV_REVIEWS_MEDIAN = 1, 1 / 2
+_STARS_WEIGHT, _INV_STARS_MEDIAN = 4, 1 / 50
+_FOLLOWERS_WEIGHT, _INV_FOLLOWERS_MEDIAN = 1, 1 / 10
+_INV_TOTAL_WEIGHT = 1 / (
+    _COMMITS_WEIGHT + _PRS_WEIGHT + _ISSUES_WEIGHT + _REVIEWS_WEIGHT + _STARS_WEIGHT + _FOLLOWERS_WEIGHT
+)
+
+# Upper percentile bound of each user rank level, best first
+_USER_RANK_THRESHOLDS = (1, 12.5, 25, 37.5, 50, 62.5, 75, 87.5, 100)
+_USER_RANK_LEVELS = ("S", "A+", "A", "A-", "B+", "B", "B-", "C+", "C")
+
+# A repository gets the base rank after the last star count it exceeds
+_REPO_STAR_THRESHOLDS = (10, 100, 1000, 10000)
+_REPO_BASE_RANKS = ("D", "C", "B", "A", "S")
+
 
 class RankResult(TypedDict):
     """Result of rank calculation."""
@@ -20,7 +43,7 @@ def exponential_cdf(x: float) -> float:
     Returns:
         CDF value
     """
-    return 1 - 2**-x
+    return 1.0 - exp2(-x)
 
 
 def log_normal_cdf(x: float) -> float:
@@ -70,45 +93,28 @@ def calculate_user_rank(
         >>> 0 <= result['percentile'] <= 100
         True
     """
-    # Median values for normalization
-    commits_median = 1000 if all_commits else 250
-    commits_weight = 2
-
-    prs_median, prs_weight = 50, 3
-    issues_median, issues_weight = 25, 1
-    reviews_median, reviews_weight = 2, 1
-    stars_median, stars_weight = 50, 4
-    followers_median, followers_weight = 10, 1
-
-    total_weight = commits_weight + prs_weight + issues_weight + reviews_weight + stars_weight + followers_weight
+    inv_commits_median = _INV_COMMITS_MEDIAN_ALL if all_commits else _INV_COMMITS_MEDIAN_YEAR
 
     # Calculate normalized rank (0 = best, 1 = worst)
     rank = (
-        1
+        1.0
         - (
-            commits_weight * exponential_cdf(commits / commits_median)
-            + prs_weight * exponential_cdf(prs / prs_median)
-            + issues_weight * exponential_cdf(issues / issues_median)
-            + reviews_weight * exponential_cdf(reviews / reviews_median)
-            + stars_weight * log_normal_cdf(stars / stars_median)
-            + followers_weight * log_normal_cdf(followers / followers_median)
+            _COMMITS_WEIGHT * exponential_cdf(commits * inv_commits_median)
+            + _PRS_WEIGHT * exponential_cdf(prs * _INV_PRS_MEDIAN)
+            + _ISSUES_WEIGHT * exponential_cdf(issues * _INV_ISSUES_MEDIAN)
+            + _REVIEWS_WEIGHT * exponential_cdf(reviews * _INV_REVIEWS_MEDIAN)
+            + _STARS_WEIGHT * log_normal_cdf(stars * _INV_STARS_MEDIAN)
+            + _FOLLOWERS_WEIGHT * log_normal_cdf(followers * _INV_FOLLOWERS_MEDIAN)
         )
-        / total_weight
+        * _INV_TOTAL_WEIGHT
     )
 
-    # Define thresholds and corresponding levels
-    thresholds = [1, 12.5, 25, 37.5, 50, 62.5, 75, 87.5, 100]
-    levels = ["S", "A+", "A", "A-", "B+", "B", "B-", "C+", "C"]
-
     # Convert to percentile (0-100)
     percentile = rank * 100
 
-    # Find the appropriate level
-    level = "C"  # Default to lowest
-    for i, threshold in enumerate(thresholds):
-        if percentile <= threshold:
-            level = levels[i]
-            break
+    # First level whose threshold is at or above the percentile; "C" beyond the last
+    index = bisect_left(_USER_RANK_THRESHOLDS, percentile)
+    level = _USER_RANK_LEVELS[min(index, len(_USER_RANK_LEVELS) - 1)]
 
     return {"level": level, "percentile": percentile}
 
@@ -125,16 +131,7 @@ def calculate_repo_rank(stars: int, total_repo_commits: int) -> str:
         Rank string (e.g., "S", "A+", "B-")
     """
     # 1. Determine base rank from stars
-    if stars > 10000:
-        base_rank = "S"
-    elif stars > 1000:
-        base_rank = "A"
-    elif stars > 100:
-        base_rank = "B"
-    elif stars > 10:
-        base_rank = "C"
-    else:
-        base_rank = "D"
+    base_rank = _REPO_BASE_RANKS[bisect_left(_REPO_STAR_THRESHOLDS, stars)]
 
     # 2. Apply modifiers based on repo magnitude (total commits)
     # If magnitude is 0 (unknown or empty), we treat it as neutral to avoid unfair downgrades.
@@ -1,5 +1,8 @@
 """Base SVG card renderer with common styling and structure."""
 
+import re
+from string import Formatter, Template
+
 from ..core.constants import (
     ANIMATION_FADE_DURATION_MS,
     ANIMATION_SCALE_DURATION_MS,
@@ -16,61 +19,8 @@ from ..core.constants import (
 from ..core.utils import encode_html
 from .colors import format_gradient
 
-
-def render_card(
-    title: str,
-    body: str,
-    width: int = 450,
-    height: int = 200,
-    colors: dict[str, str | list[str]] | None = None,
-    hide_title: bool = False,
-    hide_border: bool = False,
-    border_radius: float = 4.5,
-    disable_animations: bool = False,
-    a11y_title: str = "",
-    a11y_desc: str = "",
-) -> str:
-    """
-    Render base SVG card with title and body content.
-
-    Args:
-        title: Card title text
-        body: SVG content for the card body
-        width: Card width in pixels
-        height: Card height in pixels
-        colors: Color dictionary (title_color, text_color, bg_color, border_color, icon_color)
-        hide_title: Whether to hide the title
-        hide_border: Whether to hide the border
-        border_radius: Border radius in pixels
-        disable_animations: Whether to disable CSS animations
-        a11y_title: Accessibility title
-        a11y_desc: Accessibility description
-
-    Returns:
-        Complete SVG markup as string
-    """
-    colors = colors or {}
-
-    title_color = colors.get("title_color", "#2f80ed")
-    text_color = colors.get("text_color", "#434d58")
-    bg_color = colors.get("bg_color", "#fffefe")
-    border_color = colors.get("border_color", "#e4e2e2")
-    icon_color = colors.get("icon_color", "#4c71f2")
-
-    # Handle gradient background
-    gradient_def = ""
-    fill_color = bg_color
-
-    if isinstance(bg_color, list):
-        gradient_id, gradient_svg = format_gradient(bg_color)
-        gradient_def = gradient_svg
-        fill_color = f"url(#{gradient_id})"
-
-    # CSS styles
-    animation_css = ""
-    rank_text_animation = ""
-    if not disable_animations:
-        animation_css = f"""
+# Animation rules are identical for every card, so they are built once at import.
+_ANIMATION_CSS = f"""
         .stagger {{
           opacity: 0;
           animation: fadeInAnimation {ANIMATION_FADE_DURATION_MS / 1000}s ease-in-out forwards;
@@ -93,25 +43,18 @@ def render_card(
           }}
         }}
         """
-        rank_text_animation = f"animation: scaleInAnimation {ANIMATION_SCALE_DURATION_MS / 1000}s ease-in-out forwards;"
+_RANK_TEXT_ANIMATION = f"animation: scaleInAnimation {ANIMATION_SCALE_DURATION_MS / 1000}s ease-in-out forwards;"
 
-    # Get ring color for rank circle CSS
-    ring_color_val = colors.get("ring_color") or title_color
-    ring_color = f"#{ring_color_val[1]}" if isinstance(ring_color_val, list) else str(ring_color_val)
-
-    # Ensure ring color has # prefix if it's a hex
-    if len(ring_color) in [3, 6, 8] and not ring_color.startswith("#"):
-        ring_color = f"#{ring_color}"
-
-    css = f"""
+# Card stylesheet with fonts baked in; only the colors and animation blocks vary per card.
+_CSS_TEMPLATE = Template(f"""
     <style>
       .header {{
         font: {FONT_WEIGHT_HEADER} {FONT_SIZE_HEADER}px {FONT_FAMILY_HEADER};
-        fill: {title_color};
+        fill: $title_color;
       }}
       .stat {{
         font: {FONT_WEIGHT_STAT} {FONT_SIZE_STAT}px {FONT_FAMILY_STAT};
-        fill: {text_color};
+        fill: $text_color;
       }}
       .stat.bold {{
         font-weight: {FONT_WEIGHT_STAT_BOLD};
@@ -120,22 +63,22 @@ def render_card(
         font-weight: 400;
       }}
       .icon {{
-        fill: {icon_color};
+        fill: $icon_color;
         display: block;
       }}
       .rank-text {{
         font: {FONT_WEIGHT_RANK} {FONT_SIZE_RANK}px {FONT_FAMILY_HEADER};
-        fill: {text_color};
-        {rank_text_animation}
+        fill: $text_color;
+        $rank_text_animation
       }}
       .rank-circle-rim {{
-        stroke: {ring_color};
+        stroke: $ring_color;
         fill: none;
         stroke-width: 6;
         opacity: 0.2;
       }}
       .rank-circle {{
-        stroke: {ring_color};
+        stroke: $ring_color;
         stroke-dasharray: 250;
         fill: none;
         stroke-width: 6;
@@ -152,34 +95,16 @@ def render_card(
           transform: translate(-5px, 5px) scale(1);
         }}
       }}
-      {animation_css}
+      $animation_css
     </style>
-    """
-
-    # Encode title for safe XML embedding
-    safe_title = encode_html(title)
-    safe_a11y_title = encode_html(a11y_title or title)
-    safe_a11y_desc = encode_html(a11y_desc or f"{title} statistics")
+    """)
 
-    # Title section
-    title_section = ""
-    if not hide_title:
-        title_section = f"""
-    <g transform="translate(25, 35)">
-      <text class="header">{safe_title}</text>
-    </g>
-    """
-
-    # Adjust body position based on title visibility
-    body_y_offset = 55 if not hide_title else 25
-
-    border_opacity = 0 if hide_border else 1
-
-    svg = f"""<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}"
+# SVG skeleton shared by every card; render_card only fills in the placeholders.
+_CARD_TEMPLATE = """<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}"
      fill="none" xmlns="http://www.w3.org/2000/svg"
      role="img" aria-labelledby="titleId descId">
-  <title id="titleId">{safe_a11y_title}</title>
-  <desc id="descId">{safe_a11y_desc}</desc>
+  <title id="titleId">{a11y_title}</title>
+  <desc id="descId">{a11y_desc}</desc>
   {css}
 
   <defs>
@@ -190,9 +115,9 @@ def render_card(
     x="0.5"
     y="0.5"
     rx="{border_radius}"
-    height="{height - 1}"
+    height="{inner_height}"
     stroke="{border_color}"
-    width="{width - 1}"
+    width="{inner_width}"
     fill="{fill_color}"
     stroke-opacity="{border_opacity}"
   />
@@ -204,4 +129,156 @@ def render_card(
   </g>
 </svg>"""
 
-    return svg
+
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a str.format template into (literal, field name) pairs once, at import time."""
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+def _render_template(parts: tuple[tuple[str, str | None], ...], fields: dict[str, object]) -> str:
+    """Fill a compiled template by joining its literal fragments with the field values."""
+    out: list[str] = []
+    for literal, field in parts:
+        out.append(literal)
+        if field is not None:
+            out.append(str(fields[field]))
+    return "".join(out)
+
+
+# Whitespace between tags (and around skeleton placeholders) carries no meaning in SVG
+_INTER_TAG_WS_RE = re.compile(r">\s+<")
+_SKELETON_WS_RE = re.compile(r"(?<=>)\s+(?=\{)|(?<=\})\s+(?=<)")
+_LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+
+
+def _minify_markup(markup: str) -> str:
+    """Drop inter-tag whitespace and fold the remaining line breaks into single spaces."""
+    return _LINE_BREAK_RE.sub(" ", _INTER_TAG_WS_RE.sub("><", markup)).strip()
+
+
+_CARD_TEMPLATE_PARTS = _compile_template(_CARD_TEMPLATE)
+
+# Indexed by hide_title / hide_border
+_BODY_Y_OFFSET = (55, 25)
+_BORDER_OPACITY = (1, 0)
+
+# Minified variants are derived from the pretty ones so both stay in sync
+_MIN_CARD_TEMPLATE_PARTS = _compile_template(_minify_markup(_SKELETON_WS_RE.sub("", _CARD_TEMPLATE)))
+_MIN_CSS_TEMPLATE = Template(_LINE_BREAK_RE.sub("", _CSS_TEMPLATE.template))
+_MIN_ANIMATION_CSS = _LINE_BREAK_RE.sub("", _ANIMATION_CSS)
+
+
+def render_card(
+    title: str,
+    body: str,
+    width: int = 450,
+    height: int = 200,
+    colors: dict[str, str | list[str]] | None = None,
+    hide_title: bool = False,
+    hide_border: bool = False,
+    border_radius: float = 4.5,
+    disable_animations: bool = False,
+    a11y_title: str = "",
+    a11y_desc: str = "",
+    minify: bool = False,
+) -> str:
+    """
+    Render base SVG card with title and body content.
+
+    Args:
+        title: Card title text
+        body: SVG content for the card body
+        width: Card width in pixels
+        height: Card height in pixels
+        colors: Color dictionary (title_color, text_color, bg_color, border_color, icon_color)
+        hide_title: Whether to hide the title
+        hide_border: Whether to hide the border
+        border_radius: Border radius in pixels
+        disable_animations: Whether to disable CSS animations
+        a11y_title: Accessibility title
+        a11y_desc: Accessibility description
+        minify: Whether to strip indentation and inter-tag whitespace from the output
+
+    Returns:
+        Complete SVG markup as string
+    """
+    colors = colors or {}
+
+    title_color = colors.get("title_color", "#2f80ed")
+    text_color = colors.get("text_color", "#434d58")
+    bg_color = colors.get("bg_color", "#fffefe")
+    border_color = colors.get("border_color", "#e4e2e2")
+    icon_color = colors.get("icon_color", "#4c71f2")
+
+    # Handle gradient background (colors only ever hold plain lists, so an exact type check suffices)
+    gradient_def = ""
+    fill_color: str | list[str]
+    if type(bg_color) is list:
+        gradient_id, gradient_def = format_gradient(bg_color)
+        fill_color = f"url(#{gradient_id})"
+    else:
+        fill_color = bg_color
+
+    # CSS styles
+    animation_css = "" if disable_animations else (_MIN_ANIMATION_CSS if minify else _ANIMATION_CSS)
+    rank_text_animation = "" if disable_animations else _RANK_TEXT_ANIMATION
+
+    # Get ring color for rank circle CSS
+    ring_color_val = colors.get("ring_color") or title_color
+    ring_color = f"#{ring_color_val[1]}" if isinstance(ring_color_val, list) else str(ring_color_val)
+
+    # Ensure ring color has # prefix if it's a hex
+    if len(ring_color) in [3, 6, 8] and not ring_color.startswith("#"):
+        ring_color = f"#{ring_color}"
+
+    css = (_MIN_CSS_TEMPLATE if minify else _CSS_TEMPLATE).substitute(
+        title_color=title_color,
+        text_color=text_color,
+        icon_color=icon_color,
+        ring_color=ring_color,
+        rank_text_animation=rank_text_animation,
+        animation_css=animation_css,
+    )
+
+    # Encode title for safe XML embedding
+    safe_title = encode_html(title)
+    safe_a11y_title = encode_html(a11y_title) if a11y_title else safe_title
+    safe_a11y_desc = encode_html(a11y_desc) if a11y_desc else f"{safe_title} statistics"
+
+    # Title section
+    title_section = ""
+    if not hide_title:
+        title_section = f"""
+    <g transform="translate(25, 35)">
+      <text class="header">{safe_title}</text>
+    </g>
+    """
+
+    # Adjust body position based on title visibility (bools index the lookup tables directly)
+    body_y_offset = _BODY_Y_OFFSET[hide_title]
+    border_opacity = _BORDER_OPACITY[hide_border]
+
+    if minify:
+        title_section = _minify_markup(title_section)
+        body = _minify_markup(body)
+
+    return _render_template(
+        _MIN_CARD_TEMPLATE_PARTS if minify else _CARD_TEMPLATE_PARTS,
+        {
+            "width": width,
+            "height": height,
+            "inner_width": width - 1,
+            "inner_height": height - 1,
+            "a11y_title": safe_a11y_title,
+            "a11y_desc": safe_a11y_desc,
+            "css": css,
+            "gradient_def": gradient_def,
+            "border_radius": border_radius,
+            "border_color": border_color,
+            "fill_color": fill_color,
+            "border_opacity": border_opacity,
+            "title_section": title_section,
+            "body_y_offset": body_y_offset,
+            "body": body,
+        },
+    )
@@ -108,4 +108,5 @@ def render_contrib_card(stats: ContributorStats, config: ContribCardConfig) -> s
         disable_animations=config.disable_animations,
         a11y_title="Top Contributions Card",
         a11y_desc=f"List of top {num_items} repositories contributed to, sorted by stars.",
+        minify=config.minify,
     )
@@ -1,6 +1,9 @@
 """Top Languages card renderer with multiple layout styles."""
 
+import heapq
 import math
+from collections.abc import Iterable
+from operator import attrgetter
 
 from ..core.config import LangsCardConfig
 from ..core.constants import (
@@ -24,28 +27,27 @@ from .colors import get_card_colors
 
 
 def trim_top_languages(
-    top_langs: dict[str, Language],
+    top_langs: Iterable[Language],
     langs_count: int,
-    hide: list[str] | None = None,
+    hide: Iterable[str] | None = None,
 ) -> tuple[list[Language], int]:
     """
     Trim languages to specified count while hiding certain languages.
 
     Args:
-        top_langs: Dictionary of language name to Language object
+        top_langs: Languages to choose from, in any order
         langs_count: Maximum number of languages to show
         hide: List of language names to hide
 
     Returns:
         Tuple of (list of languages, total size of all languages)
     """
-    hide = hide or []
-    langs_to_hide = {lang.lower().strip() for lang in hide}
+    langs_to_hide = {lang.lower().strip() for lang in hide or ()}
     langs_count = int(clamp_value(int(langs_count), 1, MAXIMUM_LANGS_COUNT))
 
-    # Filter and sort by weighted score
-    langs = [lang for lang in top_langs.values() if lang.name.lower().strip() not in langs_to_hide]
-    langs = sorted(langs, key=lambda x: x.score, reverse=True)[:langs_count]
+    # Filter and keep the highest weighted scores (ties keep input order)
+    visible = (lang for lang in top_langs if lang.name.lower().strip() not in langs_to_hide)
+    langs = heapq.nlargest(langs_count, visible, key=attrgetter("score"))
 
     total_score = sum(lang.score for lang in langs)
 
@@ -361,54 +363,54 @@ def render_pie_layout(
 
 # ============ Main Renderer ============
 
+_VALID_LAYOUTS = frozenset({"normal", "compact", "donut", "donut-vertical", "pie"})
+_VALID_STATS_FORMATS = frozenset({"percentages", "bytes"})
+
 
 def render_top_languages(
-    top_langs: dict[str, Language],
+    top_langs: Iterable[Language],
     config: LangsCardConfig,
 ) -> str:
     """
     Render top languages card as SVG.
 
     Args:
-        top_langs: Dictionary of language name to Language object
+        top_langs: Languages to choose from, as returned by fetch_top_languages
         config: Configuration object with all rendering options
 
     Returns:
         SVG string
     """
     # Validate layout
-    valid_layouts = ["normal", "compact", "donut", "donut-vertical", "pie"]
-    if config.layout not in valid_layouts:
-        config.layout = "normal"
+    layout = config.layout if config.layout in _VALID_LAYOUTS else "normal"
 
     # Validate stats_format
-    if config.stats_format not in ["percentages", "bytes"]:
-        config.stats_format = "percentages"
+    stats_format = config.stats_format if config.stats_format in _VALID_STATS_FORMATS else "percentages"
 
     # Default langs_count based on layout
     langs_count = config.langs_count
     if langs_count is None:
-        langs_count = get_default_langs_count(config.layout)
+        langs_count = get_default_langs_count(layout)
 
     # Trim and filter languages
     langs, total_score = trim_top_languages(top_langs, langs_count, config.hide)
 
     # Card dimensions - use compact width for compact layout, otherwise default
-    if config.layout == "compact":
+    if layout == "compact":
         width = config.card_width or DEFAULT_LANGS_COMPACT_WIDTH
     else:
         width = config.card_width or DEFAULT_LANGS_CARD_WIDTH
     width = max(width, MIN_CARD_WIDTH)
 
     # Calculate height based on layout
-    if config.layout == "compact" or config.hide_progress:
+    if layout == "compact" or config.hide_progress:
         height = 60 + ((len(langs) + 1) // 2) * 25
         if config.hide_progress:
             height -= 25
-    elif config.layout == "donut":
+    elif layout == "donut":
         height = 215 + max(len(langs) - 5, 0) * 32
         width = width + 50
-    elif config.layout == "donut-vertical" or config.layout == "pie":
+    elif layout == "donut-vertical" or layout == "pie":
         height = 300 + ((len(langs) + 1) // 2) * 25
     else:  # normal
         height = 45 + (len(langs) + 1) * 40
@@ -435,22 +437,22 @@ def render_top_languages(
         final_layout = """
         <text x="25" y="50" class="lang-name">No languages data available</text>
         """
-    elif config.layout == "pie":
-        final_layout = render_pie_layout(langs, total_score, config.stats_format, final_text_color)
-    elif config.layout == "donut-vertical":
+    elif layout == "pie":
+        final_layout = render_pie_layout(langs, total_score, stats_format, final_text_color)
+    elif layout == "donut-vertical":
         final_layout = f"""
         <g transform="translate(0, 0)">
-          {render_pie_layout(langs, total_score, config.stats_format, final_text_color)}
+          {render_pie_layout(langs, total_score, stats_format, final_text_color)}
         </g>
         """
-    elif config.layout == "donut":
-        final_layout = render_donut_layout(langs, width, total_score, config.stats_format, final_text_color)
-    elif config.layout == "compact" or config.hide_progress:
+    elif layout == "donut":
+        final_layout = render_donut_layout(langs, width, total_score, stats_format, final_text_color)
+    elif layout == "compact" or config.hide_progress:
         final_layout = render_compact_layout(
-            langs, width, total_score, config.hide_progress, config.stats_format, final_text_color
+            langs, width, total_score, config.hide_progress, stats_format, final_text_color
         )
     else:
-        final_layout = render_normal_layout(langs, width, total_score, config.stats_format, final_text_color)
+        final_layout = render_normal_layout(langs, width, total_score, stats_format, final_text_color)
 
     # Add CSS
     css = f"""
@@ -480,7 +482,7 @@ def render_top_languages(
     """
 
     # Wrap in padding group for most layouts
-    if config.layout in ["pie", "donut-vertical"]:
+    if layout in ["pie", "donut-vertical"]:
         body = final_layout
     else:
         body = f'<svg data-testid="lang-items" x="{CARD_PADDING}">{final_layout}</svg>'
@@ -500,6 +502,7 @@ def render_top_languages(
         hide_border=config.hide_border,
         border_radius=config.border_radius,
         disable_animations=config.disable_animations,
+        minify=config.minify,
     )
 
     return svg
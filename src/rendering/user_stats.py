@@ -224,4 +224,5 @@ def render_user_stats_card(stats: UserStats, config: UserStatsCardConfig) -> str
         disable_animations=config.disable_animations,
         a11y_title=title,
         a11y_desc=f"{stats['name']}'s GitHub statistics",
+        minify=config.minify,
     )
@@ -0,0 +1,134 @@
+"""Tests for the on-disk response cache."""
+
+import os
+import time
+
+from src.core.cache import ResponseCache, default_cache_dir
+from src.core.constants import PAST_YEARS_CACHE_TTL
+
+
+def test_default_cache_dir_honors_xdg(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "github-stats-cards"
+
+
+def test_make_key_is_stable_and_distinguishes_parts():
+    assert ResponseCache.make_key("a", "b") == ResponseCache.make_key("a", "b")
+    assert ResponseCache.make_key("a", "b") != ResponseCache.make_key("ab")
+
+
+def test_set_then_get_round_trips(tmp_path):
+    cache = ResponseCache(ttl=60, directory=tmp_path / "nested")
+    key = ResponseCache.make_key("graphql", "query")
+
+    assert cache.get(key) is None
+    cache.set(key, {"data": {"user": {"login": "octocat"}}})
+
+    assert cache.get(key) == {"data": {"user": {"login": "octocat"}}}
+    assert not list((tmp_path / "nested").glob("*.tmp"))
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(ttl=60, directory=tmp_path)
+    key = ResponseCache.make_key("rest", "url")
+    cache.set(key, {"total_count": 1})
+
+    stale = time.time() - 120
+    os.utime(tmp_path / f"{key}.json", (stale, stale))
+
+    # A later run reads the entry from disk only
+    assert ResponseCache(ttl=60, directory=tmp_path).get(key) is None
+
+
+def test_get_ttl_override(tmp_path):
+    cache = ResponseCache(ttl=60, directory=tmp_path)
+    key = ResponseCache.make_key("graphql", "past years")
+    cache.set(key, {"data": {}})
+
+    stale = time.time() - 120
+    os.utime(tmp_path / f"{key}.json", (stale, stale))
+
+    fresh_cache = ResponseCache(ttl=60, directory=tmp_path)
+    assert fresh_cache.get(key) is None
+    assert fresh_cache.get(key, ttl=3600) == {"data": {}}
+    # The memory layer honors the override too
+    assert fresh_cache.get(key, ttl=0) is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(ttl=60, directory=tmp_path)
+    key = ResponseCache.make_key("rest", "url")
+    (tmp_path / f"{key}.json").write_text("{not json", encoding="utf-8")
+
+    assert cache.get(key) is None
+
+
+def test_memory_layer_serves_repeat_reads(tmp_path):
+    cache = ResponseCache(ttl=60, directory=tmp_path, memory_size=1)
+    first, second = ResponseCache.make_key("a"), ResponseCache.make_key("b")
+    cache.set(first, {"n": 1})
+    (tmp_path / f"{first}.json").unlink()
+
+    assert cache.get(first) == {"n": 1}
+
+    # Storing another entry evicts the first from the one-slot memory layer
+    cache.set(second, {"n": 2})
+    assert cache.get(first) is None
+
+
+def test_etag_revalidation_refreshes_expired_entry(tmp_path):
+    key = ResponseCache.make_key("rest", "url")
+    ResponseCache(ttl=60, directory=tmp_path).set(key, {"total_count": 3}, etag='"abc"')
+    stale = time.time() - 120
+    os.utime(tmp_path / f"{key}.json", (stale, stale))
+
+    cache = ResponseCache(ttl=60, directory=tmp_path)
+    assert cache.get(key) is None
+    assert cache.etag(key) == '"abc"'
+    assert cache.revalidate(key) == {"total_count": 3}
+    assert ResponseCache(ttl=60, directory=tmp_path).get(key) == {"total_count": 3}
+
+
+def test_set_without_etag_drops_previous_etag(tmp_path):
+    cache = ResponseCache(ttl=60, directory=tmp_path)
+    key = ResponseCache.make_key("rest", "url")
+    cache.set(key, {"total_count": 1}, etag='"old"')
+    cache.set(key, {"total_count": 2})
+
+    assert cache.etag(key) is None
+
+
+def test_first_set_evicts_entries_older_than_longest_ttl(tmp_path):
+    old_cache = ResponseCache(ttl=60, directory=tmp_path)
+    old_key = ResponseCache.make_key("rest", "old")
+    recent_key = ResponseCache.make_key("rest", "recent")
+    old_cache.set(old_key, {"old": True}, etag='"old"')
+    old_cache.set(recent_key, {"recent": True})
+    (tmp_path / "stray.tmp").write_bytes(b"")
+
+    ancient = time.time() - PAST_YEARS_CACHE_TTL - 60
+    expired = time.time() - 120
+    for name in (f"{old_key}.json", f"{old_key}.etag", "stray.tmp"):
+        os.utime(tmp_path / name, (ancient, ancient))
+    os.utime(tmp_path / f"{recent_key}.json", (expired, expired))
+
+    ResponseCache(ttl=60, directory=tmp_path).set(ResponseCache.make_key("rest", "new"), {})
+
+    assert not (tmp_path / f"{old_key}.json").exists()
+    assert not (tmp_path / f"{old_key}.etag").exists()
+    assert not (tmp_path / "stray.tmp").exists()
+    # Expired but recent entries stay, so they can still be revalidated
+    assert (tmp_path / f"{recent_key}.json").exists()
+
+
+def test_prune_keeps_etag_of_revalidated_entry(tmp_path):
+    cache = ResponseCache(ttl=60, directory=tmp_path)
+    key = ResponseCache.make_key("rest", "url")
+    cache.set(key, {"total_count": 1}, etag='"abc"')
+
+    # The body's mtime is refreshed on revalidation, the ETag file's is not
+    ancient = time.time() - PAST_YEARS_CACHE_TTL - 60
+    os.utime(tmp_path / f"{key}.etag", (ancient, ancient))
+    cache.prune()
+
+    assert cache.etag(key) == '"abc"'
@@ -1,17 +1,24 @@
 """Integration tests for CLI commands."""
 
+import ast
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
-from src.cli import cli
+import src.cli as cli_module
+from src.cli import _write_svg_file, cli
+from src.core.exceptions import LanguageFetchError
 
 
 def test_user_stats_command():
     runner = CliRunner()
     with (
-        patch("src.cli.fetch_user_stats") as mock_fetch,
-        patch("src.cli.render_user_stats_card") as mock_render,
+        patch("src.github.fetcher.fetch_user_stats") as mock_fetch,
+        patch("src.rendering.user_stats.render_user_stats_card") as mock_render,
     ):
         mock_fetch.return_value = {
             "name": "User",
@@ -39,8 +46,8 @@ def test_stats_alias_command():
     """Test that 'stats' still works as a backward-compatible alias for 'user-stats'."""
     runner = CliRunner()
     with (
-        patch("src.cli.fetch_user_stats") as mock_fetch,
-        patch("src.cli.render_user_stats_card") as mock_render,
+        patch("src.github.fetcher.fetch_user_stats") as mock_fetch,
+        patch("src.rendering.user_stats.render_user_stats_card") as mock_render,
     ):
         mock_fetch.return_value = {
             "name": "User",
@@ -67,8 +74,8 @@ def test_stats_alias_command():
 def test_top_langs_command():
     runner = CliRunner()
     with (
-        patch("src.cli.fetch_top_languages") as mock_fetch,
-        patch("src.cli.render_top_languages") as mock_render,
+        patch("src.github.langs_fetcher.fetch_top_languages") as mock_fetch,
+        patch("src.rendering.langs.render_top_languages") as mock_render,
     ):
         mock_fetch.return_value = [{"name": "Python", "color": "#3572A5", "size": 100}]
         mock_render.return_value = "<svg>langs</svg>"
@@ -79,11 +86,43 @@ def test_top_langs_command():
         assert "Generated" in result.stderr
 
 
+def test_top_langs_weighting_preset_with_override():
+    runner = CliRunner()
+    with (
+        patch("src.github.langs_fetcher.fetch_top_languages") as mock_fetch,
+        patch("src.rendering.langs.render_top_languages") as mock_render,
+    ):
+        mock_fetch.return_value = []
+        mock_render.return_value = "<svg>langs</svg>"
+
+        result = runner.invoke(
+            cli,
+            [
+                "top-langs",
+                "-u",
+                "user",
+                "-t",
+                "token",
+                "-o",
+                "langs.svg",
+                "--weighting",
+                "balanced",
+                "--count-weight",
+                "0.1",
+            ],
+        )
+
+        assert result.exit_code == 0
+        fetch_config = mock_fetch.call_args[0][0]
+        assert fetch_config.size_weight == 0.7
+        assert fetch_config.count_weight == 0.1
+
+
 def test_contrib_command():
     runner = CliRunner()
     with (
-        patch("src.cli.fetch_contributor_stats") as mock_fetch,
-        patch("src.cli.render_contrib_card") as mock_render,
+        patch("src.github.fetcher.fetch_contributor_stats") as mock_fetch,
+        patch("src.rendering.contrib.render_contrib_card") as mock_render,
     ):
         mock_fetch.return_value = {"repos": [{"name": "owner/repo", "stars": 100, "avatar_b64": "base64"}]}
         mock_render.return_value = "<svg>contrib</svg>"
@@ -97,8 +136,8 @@ def test_contrib_command():
 def test_contrib_command_with_valid_types():
     runner = CliRunner()
     with (
-        patch("src.cli.fetch_contributor_stats") as mock_fetch,
-        patch("src.cli.render_contrib_card") as mock_render,
+        patch("src.github.fetcher.fetch_contributor_stats") as mock_fetch,
+        patch("src.rendering.contrib.render_contrib_card") as mock_render,
     ):
         mock_fetch.return_value = {"repos": [{"name": "owner/repo", "stars": 100, "avatar_b64": "base64"}]}
         mock_render.return_value = "<svg>contrib</svg>"
@@ -112,7 +151,35 @@ def test_contrib_command_with_valid_types():
 
         # Verify fetch config was created with correctly parsed types
         fetch_config = mock_fetch.call_args[0][0]
-        assert fetch_config.contribution_types == ["commits", "prs"]
+        assert fetch_config.contribution_types == ("commits", "prs")
+
+
+def test_top_langs_fetch_error_exits_with_message():
+    runner = CliRunner()
+    with patch("src.github.langs_fetcher.fetch_top_languages") as mock_fetch:
+        mock_fetch.side_effect = LanguageFetchError("rate limited")
+
+        result = runner.invoke(cli, ["top-langs", "-u", "user", "-t", "token", "-o", "langs.svg"])
+
+        assert result.exit_code == 1
+        assert "❌ Error fetching language data: rate limited" in result.stderr
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["user-stats", "--number-precision", "3"],
+        ["user-stats", "--line-height", "0"],
+        ["top-langs", "--langs-count", "21"],
+        ["contrib", "--limit", "0"],
+    ],
+)
+def test_out_of_range_numbers_rejected_before_fetching(args):
+    runner = CliRunner()
+    result = runner.invoke(cli, [*args, "-u", "user", "-t", "token", "-o", "out.svg"])
+
+    assert result.exit_code == 2
+    assert "is not in the range" in result.stderr
 
 
 def test_contrib_command_with_invalid_types():
@@ -131,3 +198,49 @@ def test_contrib_command_with_empty_types():
 
     assert result.exit_code != 0
     assert "At least one contribution type is required" in result.stderr
+
+
+def test_write_svg_file_skips_identical_output(tmp_path, capsys):
+    output = tmp_path / "nested" / "card.svg"
+
+    _write_svg_file("<svg>card</svg>", str(output))
+    first_mtime = output.stat().st_mtime_ns
+    _write_svg_file("<svg>card</svg>", str(output))
+
+    assert output.read_text(encoding="utf-8") == "<svg>card</svg>"
+    assert output.stat().st_mtime_ns == first_mtime
+    assert "(unchanged)" in capsys.readouterr().err
+
+    _write_svg_file("<svg>updated</svg>", str(output))
+    assert output.read_text(encoding="utf-8") == "<svg>updated</svg>"
+
+
+def test_cli_import_defers_fetch_and_render_stack():
+    """Importing the CLI (e.g. for --help) must not pull in httpx or the renderers."""
+    code = (
+        "import sys, src.cli; "
+        "print(','.join(m for m in ('httpx', 'src.github.fetcher', 'src.github.langs_fetcher', "
+        "'src.rendering.base') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert result.stdout.strip() == ""
+
+
+def test_library_modules_do_not_import_click():
+    """Only src/cli.py may import Click, so fetchers and renderers stay usable as a library."""
+    src_root = Path(cli_module.__file__).parent
+    offenders = []
+    for path in src_root.rglob("*.py"):
+        if path.name == "cli.py":
+            continue
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            names = []
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                names = [node.module]
+            if any(name.split(".")[0] == "click" for name in names):
+                offenders.append(str(path.relative_to(src_root)))
+
+    assert offenders == []
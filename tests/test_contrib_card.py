@@ -1,8 +1,19 @@
 """Tests for contributor card configuration."""
 
+from dataclasses import FrozenInstanceError, dataclass, fields
+
 import pytest
 
-from src.core.config import ContribCardConfig, ContribFetchConfig
+from src.core.config import (
+    BaseConfig,
+    CardStyleConfig,
+    ContribCardConfig,
+    ContribFetchConfig,
+    LangsCardConfig,
+    LangsFetchConfig,
+    UserStatsCardConfig,
+    UserStatsFetchConfig,
+)
 
 
 class TestContribCardConfig:
@@ -33,6 +44,13 @@ class TestContribCardConfig:
         assert config.card_width == 467  # Default value
         assert config.theme == "dark"
 
+    def test_frozen_and_slotted(self):
+        """Test that configs are immutable and carry no per-instance __dict__."""
+        config = ContribCardConfig()
+        with pytest.raises(FrozenInstanceError):
+            config.theme = "dark"
+        assert not hasattr(config, "__dict__")
+
 
 class TestContribFetchConfig:
     def test_required_fields(self):
@@ -60,8 +78,8 @@ class TestContribFetchConfig:
         assert config.username == "testuser"
         assert config.token == "testtoken"
         assert config.limit == 5
-        assert config.exclude_repo == ["repo1", "repo2"]
-        assert config.contribution_types == ["commits", "prs"]
+        assert config.exclude_repo == ("repo1", "repo2")
+        assert config.contribution_types == ("commits", "prs")
 
     def test_validation_empty_types(self):
         """Test that empty contribution_types raises ValueError."""
@@ -72,3 +90,35 @@ class TestContribFetchConfig:
         """Test that invalid contribution_types raises ValueError."""
         with pytest.raises(ValueError, match="Invalid contribution type 'invalid'"):
             ContribFetchConfig(username="user", token="token", contribution_types=["commits", "invalid"])
+
+
+class TestConfigFieldCache:
+    @pytest.mark.parametrize(
+        "config_cls",
+        [
+            BaseConfig,
+            CardStyleConfig,
+            UserStatsCardConfig,
+            LangsCardConfig,
+            UserStatsFetchConfig,
+            LangsFetchConfig,
+            ContribCardConfig,
+            ContribFetchConfig,
+        ],
+    )
+    def test_field_names_cached_per_class(self, config_cls):
+        """Each config class caches exactly its own dataclass field names."""
+        assert config_cls.__dict__["_VALID_FIELDS"] == {f.name for f in fields(config_cls)}
+
+    def test_subclass_does_not_inherit_parent_field_set(self):
+        """A subclass defined elsewhere still accepts its own extra fields."""
+
+        @dataclass(frozen=True, slots=True)
+        class ExtendedContribConfig(ContribCardConfig):
+            badge: str = ""
+
+        config = ExtendedContribConfig.from_cli_args(theme="dark", badge="new", unknown="x")
+
+        assert config.badge == "new"
+        assert config.theme == "dark"
+        assert "badge" not in ContribCardConfig._VALID_FIELDS
@@ -1,10 +1,12 @@
 """Tests for contributor stats fetcher."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.core.config import ContribFetchConfig
+from src.core.constants import PAST_YEARS_CACHE_TTL
 from src.core.exceptions import FetchError
 from src.github.fetcher import _build_contrib_query, fetch_contributor_stats
 
@@ -51,7 +53,7 @@ def setup_mock_response(mock_client, repos_data):
 
     contribs_response = {
         "data": {
-            "user": {
+            "y2024": {
                 "contributionsCollection": {
                     "commitContributionsByRepository": commit_contribs,
                     "pullRequestContributionsByRepository": [],
@@ -149,6 +151,25 @@ def test_fetch_contributor_stats_limit(mock_client):
     assert stats["repos"][0]["name"] == "owner/repo0"
 
 
+def test_fetch_contributor_stats_downloads_shared_avatar_once(mock_client):
+    """Repos sharing an owner avatar trigger a single download."""
+    repos = [
+        {
+            "nameWithOwner": f"owner/repo{i}",
+            "isPrivate": False,
+            "stargazers": {"totalCount": 10 - i},
+            "owner": {"avatarUrl": "http://avatar", "login": "owner"},
+        }
+        for i in range(3)
+    ]
+    setup_mock_response(mock_client, repos)
+
+    stats = fetch_contributor_stats(ContribFetchConfig(username="user", token="token", limit=5))
+
+    mock_client.async_fetch_image.assert_awaited_once_with("http://avatar")
+    assert all(repo["avatar_b64"] for repo in stats["repos"])
+
+
 def test_fetch_contributor_stats_exclude(mock_client):
     """Test excluded repositories are filtered out."""
     repos = [
@@ -215,17 +236,16 @@ def test_fetch_error(mock_client):
 
 
 def test_fetch_contributor_stats_partial_error(mock_client):
-    """Test that fetcher continues if one year fails with GraphQL errors."""
+    """Test that fetcher keeps the years that resolved when another year fails with GraphQL errors."""
     # 1. Years response (2 years)
     years_response = {"data": {"user": {"contributionsCollection": {"contributionYears": [2024, 2023]}}}}
 
-    # 2. 2024 response (errors)
-    error_response = {"errors": [{"message": "Some error"}]}
-
-    # 3. 2023 response (success)
-    success_response = {
+    # 2. Batched response: 2024 failed (null alias + errors), 2023 resolved
+    contribs_response = {
+        "errors": [{"message": "Some error", "path": ["y2024"]}],
         "data": {
-            "user": {
+            "y2024": None,
+            "y2023": {
                 "contributionsCollection": {
                     "commitContributionsByRepository": [
                         {
@@ -242,11 +262,11 @@ def test_fetch_contributor_stats_partial_error(mock_client):
                     "issueContributionsByRepository": [],
                     "pullRequestReviewContributionsByRepository": [],
                 }
-            }
-        }
+            },
+        },
     }
 
-    mock_client.async_graphql_query.side_effect = [years_response, error_response, success_response]
+    mock_client.async_graphql_query.side_effect = [years_response, contribs_response]
 
     config = ContribFetchConfig(username="user", token="token", limit=5)
     stats = fetch_contributor_stats(config)
@@ -270,7 +290,7 @@ def test_fetch_contributor_stats_deduplication(mock_client):
 
     contribs_response = {
         "data": {
-            "user": {
+            "y2024": {
                 "contributionsCollection": {
                     "commitContributionsByRepository": [{"repository": repo_node, "contributions": {"totalCount": 1}}],
                     "pullRequestContributionsByRepository": [
@@ -322,7 +342,7 @@ def test_fetch_contributor_stats_rank_calculation(mock_client):
     # 2. 2024 response
     response_2024 = {
         "data": {
-            "user": {
+            "y2024": {
                 "contributionsCollection": {
                     "commitContributionsByRepository": [
                         {"repository": repo_s, "contributions": {"totalCount": 1}},
@@ -362,24 +382,73 @@ async def test_fetch_contributor_stats_inside_event_loop():
 
 def test_build_contrib_query():
     # Test with all types
-    query_all = _build_contrib_query(["commits", "prs", "issues", "reviews"])
+    query_all = _build_contrib_query(["commits", "prs", "issues", "reviews"], [2024])
     assert "commitContributionsByRepository" in query_all
     assert "pullRequestContributionsByRepository" in query_all
     assert "issueContributionsByRepository" in query_all
     assert "pullRequestReviewContributionsByRepository" in query_all
 
     # Test with partial types
-    query_partial = _build_contrib_query(["commits", "prs"])
+    query_partial = _build_contrib_query(["commits", "prs"], [2024])
     assert "commitContributionsByRepository" in query_partial
     assert "pullRequestContributionsByRepository" in query_partial
     assert "issueContributionsByRepository" not in query_partial
     assert "pullRequestReviewContributionsByRepository" not in query_partial
 
 
+def test_build_contrib_query_batches_years():
+    query = _build_contrib_query(["commits"], [2024, 2023])
+    assert query.count("commitContributionsByRepository") == 2
+    assert "y2024: user(login: $login)" in query
+    assert "contributionsCollection(from: $from2023, to: $to2023)" in query
+    assert "$from2024: DateTime!, $to2024: DateTime!" in query
+
+
+def test_fetch_contributor_stats_single_contributions_request(mock_client):
+    """All years are fetched with one batched query after the years lookup."""
+    years_response = {"data": {"user": {"contributionsCollection": {"contributionYears": [2023, 2024]}}}}
+    mock_client.async_graphql_query.side_effect = [years_response, {"data": {"y2024": None, "y2023": None}}]
+
+    config = ContribFetchConfig(username="user", token="token")
+    stats = fetch_contributor_stats(config)
+
+    assert stats["repos"] == []
+    assert mock_client.async_graphql_query.await_count == 2
+    variables = mock_client.async_graphql_query.await_args.args[1]
+    assert variables == {
+        "login": "user",
+        "from2024": "2024-01-01T00:00:00Z",
+        "to2024": "2024-12-31T23:59:59Z",
+        "from2023": "2023-01-01T00:00:00Z",
+        "to2023": "2023-12-31T23:59:59Z",
+    }
+
+
+def test_fetch_contributor_stats_caches_past_years_longer(mock_client):
+    """With caching on, finished years are fetched in their own long-lived batch."""
+    current_year = datetime.now(UTC).year
+    past_year = current_year - 1
+    years_response = {"data": {"user": {"contributionsCollection": {"contributionYears": [current_year, past_year]}}}}
+    mock_client.async_graphql_query.side_effect = [
+        years_response,
+        {"data": {f"y{current_year}": None}},
+        {"data": {f"y{past_year}": None}},
+    ]
+
+    config = ContribFetchConfig(username="user", token="token", cache_ttl=600)
+    fetch_contributor_stats(config)
+
+    _, current_call, past_call = mock_client.async_graphql_query.await_args_list
+    assert set(current_call.args[1]) == {"login", f"from{current_year}", f"to{current_year}"}
+    assert current_call.kwargs["cache_ttl"] is None
+    assert set(past_call.args[1]) == {"login", f"from{past_year}", f"to{past_year}"}
+    assert past_call.kwargs["cache_ttl"] == PAST_YEARS_CACHE_TTL
+
+
 def test_build_contrib_query_empty_raises():
     """Test that _build_contrib_query raises ValueError on empty list."""
     with pytest.raises(ValueError, match="must not be empty"):
-        _build_contrib_query([])
+        _build_contrib_query([], [2024])
 
 
 def test_fetch_contributor_stats_pr_filtering(mock_client):
@@ -398,7 +467,7 @@ def test_fetch_contributor_stats_pr_filtering(mock_client):
 
     contribs_response = {
         "data": {
-            "user": {
+            "y2024": {
                 "contributionsCollection": {
                     "commitContributionsByRepository": [],
                     "pullRequestContributionsByRepository": [
@@ -1,10 +1,15 @@
 """Tests for GitHub API client."""
 
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import httpx
 import pytest
 
+from src.core.constants import AVATAR_MAX_BYTES
 from src.core.exceptions import APIError
 from src.github.client import GitHubClient
 
@@ -26,8 +31,8 @@ def test_graphql_query_success(client):
         mock_client_prop.return_value = mock_httpx_client
 
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.json.return_value = {"data": {"user": "test"}}
-        mock_response.raise_for_status.return_value = None
         mock_httpx_client.post.return_value = mock_response
 
         result = client.graphql_query("query", {"var": "val"})
@@ -36,6 +41,28 @@ def test_graphql_query_success(client):
         mock_httpx_client.post.assert_called_once()
 
 
+def test_graphql_query_sends_compacted_query(client):
+    query = """
+    query q($login: String!) {
+      user(login: $login) {  # trailing comment
+        object(expression: "HEAD  # not a comment") { id }
+      }
+    }
+    """
+    with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
+        mock_httpx_client = MagicMock()
+        mock_client_prop.return_value = mock_httpx_client
+        mock_httpx_client.post.return_value.status_code = 200
+        mock_httpx_client.post.return_value.json.return_value = {"data": {}}
+
+        client.graphql_query(query, {"login": "octocat"})
+
+        sent = mock_httpx_client.post.call_args.kwargs["json"]["query"]
+        assert sent == (
+            'query q($login: String!) { user(login: $login) { object(expression: "HEAD  # not a comment") { id } } }'
+        )
+
+
 def test_graphql_query_error(client):
     with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
         mock_httpx_client = MagicMock()
@@ -54,8 +81,8 @@ async def test_async_graphql_query_success(client):
 
         mock_httpx_client.post = AsyncMock()
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.json.return_value = {"data": {"user": "test"}}
-        mock_response.raise_for_status.return_value = None
         mock_httpx_client.post.return_value = mock_response
 
         result = await client.async_graphql_query("query", {"var": "val"})
@@ -83,8 +110,8 @@ def test_rest_get_success(client):
         mock_client_prop.return_value = mock_httpx_client
 
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.json.return_value = {"id": 123}
-        mock_response.raise_for_status.return_value = None
         mock_httpx_client.get.return_value = mock_response
 
         result = client.rest_get("https://api.github.com/user")
@@ -93,6 +120,33 @@ def test_rest_get_success(client):
         mock_httpx_client.get.assert_called_once()
 
 
+def test_rest_get_merges_extra_headers_without_mutating_defaults(client):
+    with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
+        mock_httpx_client = MagicMock()
+        mock_client_prop.return_value = mock_httpx_client
+        mock_httpx_client.get.return_value.status_code = 200
+        mock_httpx_client.get.return_value.json.return_value = {}
+
+        client.rest_get("https://api.github.com/search/commits", headers={"Accept": "application/vnd.github+json"})
+        client.rest_get("https://api.github.com/user")
+
+        merged, plain = (call.kwargs["headers"] for call in mock_httpx_client.get.call_args_list)
+        assert merged["Accept"] == "application/vnd.github+json"
+        assert merged["Authorization"] == "Bearer fake-token"
+        assert plain is client.headers
+        assert "Accept" not in client.headers
+
+
+def test_rest_get_error_status_raises_api_error(client):
+    with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
+        mock_client_prop.return_value = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404, text='{"message":"Not Found"}'))
+        )
+
+        with pytest.raises(APIError, match=r"HTTP 404: .*Not Found"):
+            client.rest_get("https://api.github.com/users/missing")
+
+
 def test_rest_get_error(client):
     with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
         mock_httpx_client = MagicMock()
@@ -103,15 +157,19 @@ def test_rest_get_error(client):
             client.rest_get("https://api.github.com/user")
 
 
+def _image_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/missing.png":
+        return httpx.Response(404)
+    if request.url.path == "/huge.png":
+        return httpx.Response(200, content=b"x" * (AVATAR_MAX_BYTES + 1))
+    assert request.headers["Accept"] == "image/*"
+    assert request.headers["Accept-Encoding"] == "identity"
+    return httpx.Response(200, content=b"image-data")
+
+
 def test_fetch_image_success(client):
     with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
-        mock_httpx_client = MagicMock()
-        mock_client_prop.return_value = mock_httpx_client
-
-        mock_response = MagicMock()
-        mock_response.content = b"image-data"
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_client.get.return_value = mock_response
+        mock_client_prop.return_value = httpx.Client(transport=httpx.MockTransport(_image_handler))
 
         result = client.fetch_image("https://example.com/image.png")
 
@@ -120,45 +178,35 @@ def test_fetch_image_success(client):
 
 def test_fetch_image_error(client):
     with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
-        mock_httpx_client = MagicMock()
-        mock_client_prop.return_value = mock_httpx_client
-        mock_httpx_client.get.side_effect = httpx.HTTPError("Network error")
+        mock_client_prop.return_value = httpx.Client(transport=httpx.MockTransport(_image_handler))
 
-        result = client.fetch_image("https://example.com/image.png")
+        assert client.fetch_image("https://example.com/missing.png") is None
+
+
+def test_fetch_image_rejects_oversized_body(client):
+    with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
+        mock_client_prop.return_value = httpx.Client(transport=httpx.MockTransport(_image_handler))
 
-        assert result is None
+        assert client.fetch_image("https://example.com/huge.png") is None
 
 
 @pytest.mark.anyio
 async def test_async_fetch_image_success(client):
     with patch("src.github.client.GitHubClient.async_client", new_callable=PropertyMock) as mock_client_prop:
-        mock_httpx_client = MagicMock()
-        mock_client_prop.return_value = mock_httpx_client
-
-        mock_httpx_client.get = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = b"image-data"
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_client.get.return_value = mock_response
+        mock_client_prop.return_value = httpx.AsyncClient(transport=httpx.MockTransport(_image_handler))
 
         result = await client.async_fetch_image("https://example.com/image.png")
 
         assert result == b"image-data"
-        mock_httpx_client.get.assert_awaited_once()
 
 
 @pytest.mark.anyio
 async def test_async_fetch_image_error(client):
     with patch("src.github.client.GitHubClient.async_client", new_callable=PropertyMock) as mock_client_prop:
-        mock_httpx_client = MagicMock()
-        mock_client_prop.return_value = mock_httpx_client
+        mock_client_prop.return_value = httpx.AsyncClient(transport=httpx.MockTransport(_image_handler))
 
-        mock_httpx_client.get = AsyncMock(side_effect=httpx.HTTPError("Network error"))
-
-        result = await client.async_fetch_image("https://example.com/image.png")
-
-        assert result is None
-        mock_httpx_client.get.assert_awaited_once()
+        assert await client.async_fetch_image("https://example.com/missing.png") is None
+        assert await client.async_fetch_image("https://example.com/huge.png") is None
 
 
 @pytest.mark.anyio
@@ -172,3 +220,187 @@ async def test_context_manager(client):
         async with client as c:
             assert c == client
         mock_aclose.assert_called_once()
+
+
+def test_graphql_query_uses_response_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cached_client = GitHubClient(token="fake-token", cache_ttl=60)
+    with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
+        mock_httpx_client = MagicMock()
+        mock_client_prop.return_value = mock_httpx_client
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": {"user": "test"}}
+        mock_httpx_client.post.return_value = mock_response
+
+        first = cached_client.graphql_query("query", {"var": "val"})
+        second = cached_client.graphql_query("query", {"var": "val"})
+
+        assert first == second == {"data": {"user": "test"}}
+        mock_httpx_client.post.assert_called_once()
+
+        # A different token must not see the first token's cached data
+        GitHubClient(token="other-token", cache_ttl=60).graphql_query("query", {"var": "val"})
+        assert mock_httpx_client.post.call_count == 2
+
+
+def test_graphql_cache_key_depends_on_query_and_variables():
+    cached_client = GitHubClient(token="fake-token", cache_ttl=60)
+    key = cached_client._graphql_cache_key("query a", {"var": "val"})
+
+    assert key == cached_client._graphql_cache_key("query a", {"var": "val"})
+    assert key != cached_client._graphql_cache_key("query b", {"var": "val"})
+    assert key != cached_client._graphql_cache_key("query a", {"var": "other"})
+
+
+def test_graphql_query_does_not_cache_errors(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cached_client = GitHubClient(token="fake-token", cache_ttl=60)
+    with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
+        mock_httpx_client = MagicMock()
+        mock_client_prop.return_value = mock_httpx_client
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"errors": [{"message": "rate limited"}]}
+        mock_httpx_client.post.return_value = mock_response
+
+        cached_client.graphql_query("query")
+        cached_client.graphql_query("query")
+
+        assert mock_httpx_client.post.call_count == 2
+
+
+def test_rest_get_revalidates_expired_entry_with_etag(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    url = "https://api.github.com/search/issues?q=author:octocat"
+    with patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop:
+        mock_httpx_client = MagicMock()
+        mock_client_prop.return_value = mock_httpx_client
+        request = httpx.Request("GET", url)
+        mock_httpx_client.get.return_value = httpx.Response(
+            200, json={"total_count": 7}, headers={"ETag": '"v1"'}, request=request
+        )
+        GitHubClient(token="fake-token", cache_ttl=60).rest_get(url)
+
+        # Expire the entry on disk, then see it confirmed by a 304
+        for entry in (tmp_path / "github-stats-cards").glob("*.json"):
+            os.utime(entry, (0, 0))
+        mock_httpx_client.get.return_value = httpx.Response(304, request=request)
+        result = GitHubClient(token="fake-token", cache_ttl=60).rest_get(url)
+
+        assert result == {"total_count": 7}
+        assert mock_httpx_client.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_rest_get_retries_once_after_retry_after(client):
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+    with (
+        patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop,
+        patch("src.github.client.time.sleep") as mock_sleep,
+    ):
+        mock_client_prop.return_value = httpx.Client(transport=httpx.MockTransport(lambda request: next(responses)))
+
+        assert client.rest_get("https://api.github.com/user") == {"ok": True}
+        mock_sleep.assert_called_once_with(2.0)
+
+
+def test_rest_get_waits_when_rate_limit_is_nearly_exhausted(client):
+    reset = time.time() + 30
+    rate_headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}
+    with (
+        patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop,
+        patch("src.github.client.time.sleep") as mock_sleep,
+    ):
+        mock_client_prop.return_value = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}, headers=rate_headers))
+        )
+
+        client.rest_get("https://api.github.com/user")
+        mock_sleep.assert_not_called()
+
+        client.rest_get("https://api.github.com/user")
+        (wait,), _ = mock_sleep.call_args
+        assert 0 < wait <= 30
+
+
+def test_low_search_limit_does_not_delay_graphql(client):
+    reset = str(time.time() + 50)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/search/"):
+            headers = {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": reset, "X-RateLimit-Resource": "search"}
+        else:
+            headers = {"X-RateLimit-Remaining": "4990", "X-RateLimit-Reset": reset, "X-RateLimit-Resource": "graphql"}
+        return httpx.Response(200, json={"data": {}}, headers=headers)
+
+    with (
+        patch("src.github.client.GitHubClient.client", new_callable=PropertyMock) as mock_client_prop,
+        patch("src.github.client.time.sleep") as mock_sleep,
+    ):
+        mock_client_prop.return_value = httpx.Client(transport=httpx.MockTransport(handler))
+
+        client.rest_get("https://api.github.com/search/issues?q=author:octocat")
+        client.graphql_query("query { viewer { login } }")
+        mock_sleep.assert_not_called()
+
+        # The search limit itself is still honored
+        client.rest_get("https://api.github.com/search/commits?q=author:octocat")
+        mock_sleep.assert_called_once()
+
+
+@pytest.mark.parametrize("client_attr", ["client", "async_client"])
+def test_clients_route_through_environment_proxy(monkeypatch, client_attr):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example")
+
+    http_client = getattr(GitHubClient(token="fake-token"), client_attr)
+
+    proxied = http_client._transport_for_url(httpx.URL("https://api.github.com/graphql"))
+    assert type(proxied._pool).__name__.endswith("HTTPProxy")
+    assert proxied._pool._proxy_url.host == b"proxy.example"
+    # NO_PROXY hosts and plain HTTP (no HTTP_PROXY set) connect directly through the retrying transport
+    assert http_client._transport_for_url(httpx.URL("https://ghe.internal.example/api")) is http_client._transport
+    assert http_client._transport_for_url(httpx.URL("http://example.com/")) is http_client._transport
+
+
+def test_rest_get_is_sent_through_environment_proxy(monkeypatch):
+    seen = []
+
+    class ProxyHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.path)
+            body = b'{"proxied": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), ProxyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+        monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_port}")
+
+        with GitHubClient(token="fake-token") as gh:
+            assert gh.rest_get("http://api.github.invalid/user") == {"proxied": True}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # A proxy receives the absolute URL of the target
+    assert seen == ["http://api.github.invalid/user"]
@@ -67,12 +67,12 @@ def test_fetch_top_languages_success(MockClient):
     config = LangsFetchConfig(username="testuser", token="testtoken")
     result = fetch_top_languages(config)
 
-    assert len(result) == 2
-    assert "Python" in result
-    assert result["Python"].size == 100
-    assert result["Python"].score == 100  # default weights: score == size
-    assert result["JavaScript"].size == 50
-    assert result["Python"].color == "#3572A5"
+    assert [lang.name for lang in result] == ["Python", "JavaScript"]  # sorted by score
+    langs = {lang.name: lang for lang in result}
+    assert langs["Python"].size == 100
+    assert langs["Python"].score == 100  # default weights: score == size
+    assert langs["JavaScript"].size == 50
+    assert langs["Python"].color == "#3572A5"
 
 
 @patch("src.github.langs_fetcher.GitHubClient")
@@ -94,9 +94,7 @@ def test_fetch_top_languages_exclude_repos(MockClient):
     config = LangsFetchConfig(username="testuser", token="testtoken", exclude_repo=["repo2"])
     result = fetch_top_languages(config)
 
-    assert len(result) == 1
-    assert "Python" in result
-    assert "JavaScript" not in result
+    assert [lang.name for lang in result] == ["Python"]
 
 
 @patch("src.github.langs_fetcher.GitHubClient")
@@ -113,8 +111,9 @@ def test_fetch_top_languages_with_weights(MockClient):
     config = LangsFetchConfig(username="testuser", token="testtoken", size_weight=0.5, count_weight=1.0)
     result = fetch_top_languages(config)
 
-    assert result["Python"].score == 28
-    assert result["Python"].size == 200  # original bytes preserved
+    assert result[0].name == "Python"
+    assert result[0].score == 28
+    assert result[0].size == 200  # original bytes preserved
 
 
 @patch("src.github.langs_fetcher.GitHubClient")
@@ -131,7 +130,7 @@ def test_fetch_top_languages_missing_color(MockClient):
 
     config = LangsFetchConfig(username="testuser", token="testtoken")
     result = fetch_top_languages(config)
-    assert result["Python"].color == "#858585"  # Default color
+    assert result[0].color == "#858585"  # Default color
 
 
 # ---------------------------------------------------------------------------
@@ -197,6 +196,7 @@ def test_fetch_top_languages_pagination(MockClient):
     config = LangsFetchConfig(username="testuser", token="testtoken")
     result = fetch_top_languages(config)
 
-    assert result["Python"].size == 300
-    assert result["Python"].count == 2
+    assert result[0].name == "Python"
+    assert result[0].size == 300
+    assert result[0].count == 2
     assert MockClient.return_value.graphql_query.call_count == 2
@@ -1,5 +1,7 @@
 """Tests for user stats card rendering."""
 
+import re
+
 import pytest
 
 from src.core.config import UserStatsCardConfig
@@ -68,3 +70,16 @@ def test_render_user_stats_card_custom_title(sample_stats):
     config = UserStatsCardConfig(custom_title="My Progress")
     svg = render_user_stats_card(sample_stats, config)
     assert "My Progress" in svg
+
+
+def test_render_user_stats_card_minify(sample_stats):
+    pretty = render_user_stats_card(sample_stats, UserStatsCardConfig(show_icons=True))
+    svg = render_user_stats_card(sample_stats, UserStatsCardConfig(show_icons=True, minify=True))
+
+    assert len(svg) < len(pretty)
+    assert "\n" not in svg
+    assert "> <" not in svg
+
+    # Same visible text, only the surrounding whitespace differs
+    text_re = re.compile(r"<text[^>]*>([^<]*)</text>")
+    assert [t.strip() for t in text_re.findall(svg)] == [t.strip() for t in text_re.findall(pretty)]
@@ -1,20 +1,22 @@
 """Tests for user stats fetcher."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.core.config import UserStatsFetchConfig
-from src.core.exceptions import FetchError
-from src.github.fetcher import fetch_user_stats
+from src.core.exceptions import APIError, FetchError
+from src.github.fetcher import _USER_QUERY, _USER_REPOS_PAGE_QUERY, fetch_user_stats
 
 
 @pytest.fixture
 def mock_client():
     with patch("src.github.fetcher.GitHubClient") as MockClient:
         client_instance = MockClient.return_value
-        client_instance.__enter__.return_value = client_instance
-        client_instance.__exit__.return_value = False
+        client_instance.async_graphql_query = AsyncMock()
+        client_instance.async_rest_get = AsyncMock()
+        client_instance.__aenter__ = AsyncMock(return_value=client_instance)
+        client_instance.__aexit__ = AsyncMock(return_value=None)
         yield client_instance
 
 
@@ -32,24 +34,23 @@ def test_fetch_user_stats_success(mock_client):
                 "repositoriesContributedTo": {"totalCount": 10},
                 "pullRequests": {"totalCount": 20},
                 "mergedPullRequests": {"totalCount": 15},
-                "openIssues": {"totalCount": 5},
-                "closedIssues": {"totalCount": 5},
+                "issues": {"totalCount": 10},
                 "followers": {"totalCount": 100},
                 "repositories": {
                     "nodes": [
-                        {"stargazers": {"totalCount": 10}},
-                        {"stargazers": {"totalCount": 20}},
+                        {"stargazerCount": 10},
+                        {"stargazerCount": 20},
                     ],
                     "pageInfo": {"hasNextPage": False, "endCursor": None},
                 },
             }
         }
     }
-    mock_client.graphql_query.return_value = mock_response
-    mock_client.rest_get.side_effect = [
-        {"total_count": 100},  # Commits search
-        {"total_count": 10},  # Issues search
-    ]
+    mock_client.async_graphql_query.return_value = mock_response
+    search_counts = {"/search/commits": 100, "/search/issues": 10}
+    mock_client.async_rest_get.side_effect = lambda url, headers=None: {
+        "total_count": next(count for path, count in search_counts.items() if path in url)
+    }
 
     config = UserStatsFetchConfig(username="testuser", token="fake-token", include_all_commits=True)
     stats = fetch_user_stats(config)
@@ -62,7 +63,7 @@ def test_fetch_user_stats_success(mock_client):
 
 def test_fetch_user_stats_graphql_error(mock_client):
     """Test handling of GraphQL errors."""
-    mock_client.graphql_query.return_value = {"errors": [{"message": "Some error"}]}
+    mock_client.async_graphql_query.return_value = {"errors": [{"message": "Some error"}]}
 
     config = UserStatsFetchConfig(username="testuser", token="fake-token")
     with pytest.raises(FetchError, match="GraphQL error: Some error"):
@@ -71,7 +72,7 @@ def test_fetch_user_stats_graphql_error(mock_client):
 
 def test_fetch_user_stats_not_found(mock_client):
     """Test handling of user not found."""
-    mock_client.graphql_query.return_value = {"data": {"user": None}}
+    mock_client.async_graphql_query.return_value = {"data": {"user": None}}
 
     config = UserStatsFetchConfig(username="nonexistent", token="fake-token")
     with pytest.raises(FetchError, match="User 'nonexistent' not found"):
@@ -90,11 +91,10 @@ def test_fetch_user_stats_pagination(mock_client):
                 "repositoriesContributedTo": {"totalCount": 0},
                 "pullRequests": {"totalCount": 0},
                 "mergedPullRequests": {"totalCount": 0},
-                "openIssues": {"totalCount": 0},
-                "closedIssues": {"totalCount": 0},
+                "issues": {"totalCount": 0},
                 "followers": {"totalCount": 0},
                 "repositories": {
-                    "nodes": [{"stargazers": {"totalCount": 10}}],
+                    "nodes": [{"stargazerCount": 10}],
                     "pageInfo": {"hasNextPage": True, "endCursor": "cursor1"},
                 },
             }
@@ -105,20 +105,24 @@ def test_fetch_user_stats_pagination(mock_client):
         "data": {
             "user": {
                 "repositories": {
-                    "nodes": [{"stargazers": {"totalCount": 5}}],
+                    "nodes": [{"stargazerCount": 5}],
                     "pageInfo": {"hasNextPage": False, "endCursor": None},
                 }
             }
         }
     }
-    mock_client.graphql_query.side_effect = [resp1, resp2]
-    mock_client.rest_get.return_value = {"total_count": 0}
+    mock_client.async_graphql_query.side_effect = [resp1, resp2]
+    mock_client.async_rest_get.return_value = {"total_count": 0}
 
     config = UserStatsFetchConfig(username="user", token="fake-token")
     stats = fetch_user_stats(config)
 
     assert stats["totalStars"] == 15
-    assert mock_client.graphql_query.call_count == 2
+    assert mock_client.async_graphql_query.call_count == 2
+    first_call, page_call = mock_client.async_graphql_query.await_args_list
+    assert first_call.args[0] == _USER_QUERY
+    assert "from" not in first_call.args[1]
+    assert page_call.args == (_USER_REPOS_PAGE_QUERY, {"login": "user", "after": "cursor1"})
 
 
 def test_fetch_user_stats_with_discussions(mock_client):
@@ -132,9 +136,10 @@ def test_fetch_user_stats_with_discussions(mock_client):
                 "repositoriesContributedTo": {"totalCount": 0},
                 "pullRequests": {"totalCount": 0},
                 "mergedPullRequests": {"totalCount": 0},
-                "openIssues": {"totalCount": 0},
-                "closedIssues": {"totalCount": 0},
+                "issues": {"totalCount": 0},
                 "followers": {"totalCount": 0},
+                "repositoryDiscussions": {"totalCount": 5},
+                "repositoryDiscussionComments": {"totalCount": 3},
                 "repositories": {
                     "nodes": [],
                     "pageInfo": {"hasNextPage": False, "endCursor": None},
@@ -142,16 +147,8 @@ def test_fetch_user_stats_with_discussions(mock_client):
             }
         }
     }
-    disc_response = {
-        "data": {
-            "user": {
-                "repositoryDiscussions": {"totalCount": 5},
-                "repositoryDiscussionComments": {"totalCount": 3},
-            }
-        }
-    }
-    mock_client.graphql_query.side_effect = [mock_response, disc_response]
-    mock_client.rest_get.return_value = {"total_count": 0}
+    mock_client.async_graphql_query.return_value = mock_response
+    mock_client.async_rest_get.return_value = {"total_count": 0}
 
     config = UserStatsFetchConfig(
         username="user", token="fake-token", show=["discussions_started", "discussions_answered"]
@@ -160,3 +157,84 @@ def test_fetch_user_stats_with_discussions(mock_client):
 
     assert stats["discussionsStarted"] == 5
     assert stats["discussionsAnswered"] == 3
+    # Discussions are part of the main query, not a separate request
+    mock_client.async_graphql_query.assert_awaited_once()
+    assert mock_client.async_graphql_query.await_args.args[1]["withDiscussions"] is True
+
+
+def test_fetch_user_stats_search_failure_falls_back_to_graphql(mock_client):
+    """Failed REST searches fall back to the counts from the GraphQL query."""
+    mock_client.async_graphql_query.return_value = {
+        "data": {
+            "user": {
+                "name": None,
+                "login": "user",
+                "contributionsCollection": {"totalCommitContributions": 7, "totalPullRequestReviewContributions": 0},
+                "repositoriesContributedTo": {"totalCount": 0},
+                "pullRequests": {"totalCount": 0},
+                "mergedPullRequests": {"totalCount": 0},
+                "issues": {"totalCount": 5},
+                "followers": {"totalCount": 0},
+                "repositories": {"nodes": [], "pageInfo": {"hasNextPage": False, "endCursor": None}},
+            }
+        }
+    }
+    mock_client.async_rest_get.side_effect = APIError("rate limited")
+
+    config = UserStatsFetchConfig(username="user", token="fake-token", include_all_commits=True)
+    stats = fetch_user_stats(config)
+
+    assert stats["name"] == "user"
+    assert stats["totalCommits"] == 7
+    assert stats["totalIssues"] == 5
+    assert mock_client.async_rest_get.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_fetch_user_stats_inside_event_loop():
+    """fetch_user_stats refuses to nest an event loop and points to the async variant."""
+    config = UserStatsFetchConfig(username="user", token="fake-token")
+    with pytest.raises(FetchError, match="async_fetch_user_stats"):
+        fetch_user_stats(config)
+
+
+def test_fetch_user_stats_commits_year_sets_date_range(mock_client):
+    """A commits year fills the nullable date-range variables of the user query."""
+    mock_client.async_graphql_query.return_value = {"data": {"user": None}}
+
+    config = UserStatsFetchConfig(username="user", token="fake-token", commits_year=2023)
+    with pytest.raises(FetchError):
+        fetch_user_stats(config)
+
+    query, variables = mock_client.async_graphql_query.await_args.args
+    assert query == _USER_QUERY
+    assert variables["from"] == "2023-01-01T00:00:00Z"
+    assert variables["to"] == "2023-12-31T23:59:59Z"
+
+
+def test_fetch_user_stats_pagination_stops_at_unstarred_repo(mock_client):
+    """Pages ordered by stars are not followed past an unstarred repository."""
+    mock_client.async_graphql_query.return_value = {
+        "data": {
+            "user": {
+                "name": "User",
+                "login": "user",
+                "contributionsCollection": {"totalCommitContributions": 0, "totalPullRequestReviewContributions": 0},
+                "repositoriesContributedTo": {"totalCount": 0},
+                "pullRequests": {"totalCount": 0},
+                "mergedPullRequests": {"totalCount": 0},
+                "issues": {"totalCount": 0},
+                "followers": {"totalCount": 0},
+                "repositories": {
+                    "nodes": [{"stargazerCount": 3}, {"stargazerCount": 0}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor1"},
+                },
+            }
+        }
+    }
+    mock_client.async_rest_get.return_value = {"total_count": 0}
+
+    stats = fetch_user_stats(UserStatsFetchConfig(username="user", token="fake-token"))
+
+    assert stats["totalStars"] == 3
+    assert mock_client.async_graphql_query.call_count == 1
@@ -2,7 +2,14 @@
 
 import pytest
 
-from src.core.utils import clamp_value, encode_html, is_repo_excluded, k_formatter, parse_list_arg
+from src.core.utils import (
+    _compile_excludes,
+    clamp_value,
+    encode_html,
+    is_repo_excluded,
+    k_formatter,
+    parse_list_arg,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -18,6 +25,9 @@ from src.core.utils import clamp_value, encode_html, is_repo_excluded, k_formatt
         (6626, {}, "6.6k"),
         (10000, {}, "10k"),
         (-1500, {}, "-1.5k"),
+        (-999, {}, "-999"),
+        (1_000_000_000, {}, "1000000k"),
+        (123_456_789, {}, "123456.8k"),
         (6626, {"precision": 0}, "7k"),
         (6626, {"precision": 1}, "6.6k"),
         (6626, {"precision": 2}, "6.63k"),
@@ -37,6 +47,8 @@ def test_k_formatter(value: int, kwargs: dict, expected: str):
         (-5, 0, 10, 0),
         (15, 0, 10, 10),
         (7.5, 0, 10, 7.5),
+        (0, 0, 10, 0),
+        (10, 0, 10, 10),
     ],
 )
 def test_clamp_value(value, lo, hi, expected):
@@ -54,25 +66,37 @@ def test_clamp_value(value, lo, hi, expected):
         ("A & B", "A &amp; B"),
         ('"quoted"', "&quot;quoted&quot;"),
         ("'single'", "&#39;single&#39;"),
+        ("<a title='x'>&amp;</a>", "&lt;a title=&#39;x&#39;&gt;&amp;amp;&lt;/a&gt;"),
     ],
 )
 def test_encode_html(text: str, expected: str):
     assert encode_html(text) == expected
 
 
+def test_encode_html_cache_is_bounded():
+    encode_html.cache_clear()
+    encode_html("A & B")
+    encode_html("A & B")
+
+    info = encode_html.cache_info()
+    assert info.maxsize == 512
+    assert info.hits == 1
+
+
 # ---------------------------------------------------------------------------
 # parse_list_arg
 # ---------------------------------------------------------------------------
 @pytest.mark.parametrize(
     ("arg", "expected"),
     [
-        (None, []),
-        ("", []),
-        ("foo", ["foo"]),
-        ("foo,bar", ["foo", "bar"]),
-        (" foo , bar ", ["foo", "bar"]),
-        (["foo", "bar"], ["foo", "bar"]),
-        ([" foo ", " bar "], ["foo", "bar"]),
+        (None, ()),
+        ("", ()),
+        ("foo", ("foo",)),
+        ("foo,bar", ("foo", "bar")),
+        (" foo , bar ", ("foo", "bar")),
+        (["foo", "bar"], ("foo", "bar")),
+        ([" foo ", " bar "], ("foo", "bar")),
+        (("foo", " ", "bar"), ("foo", "bar")),
     ],
 )
 def test_parse_list_arg(arg, expected):
@@ -102,6 +126,11 @@ def test_parse_list_arg(arg, expected):
         # Case insensitive matching
         ("AWESOME-apps", ["awesome-*"], True),
         ("awesome-apps", ["AWESOME-*"], True),
+        ("Owner/Repo", ["owner/repo"], True),
+        # Character classes and single-character wildcards
+        ("owner/repo-1", ["owner/repo-[0-9]"], True),
+        ("owner/repo-x", ["owner/repo-[0-9]"], False),
+        ("owner/repo-x", ["repo-?"], True),
         # Multiple patterns
         ("stn1slv/test-repo", ["awesome-*", "test-*"], True),
         # Empty patterns
@@ -110,3 +139,14 @@ def test_parse_list_arg(arg, expected):
 )
 def test_is_repo_excluded(repo: str, patterns: list[str], expected: bool):
     assert is_repo_excluded(repo, patterns) is expected
+
+
+def test_is_repo_excluded_compiles_patterns_once():
+    _compile_excludes.cache_clear()
+    patterns = ("awesome-*", "owner/repo")
+    for repo in ("owner/repo", "owner/awesome-x", "owner/other"):
+        is_repo_excluded(repo, patterns)
+
+    info = _compile_excludes.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2